@@ -0,0 +1,130 @@
+"""
+Compiled Kernels for the Eligibility Pipeline
+=============================================
+Numba-compiled loops over the raw bytes of Arrow string columns.
+
+Each kernel fills preallocated output arrays and flags the rows it could
+not handle, so callers fall back to the pure-Python transformers in
+pipeline.py for those rows. When Numba is not installed every kernel is
+None and callers use the Python/Arrow paths throughout.
+"""
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # Optional: callers fall back to Arrow compute and Python
+    numba = None
+    np = None
+
+NUMBA_AVAILABLE = numba is not None
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True, nogil=True, boundscheck=False)
+    def digits_only(buf, start, end, out):
+        """
+        Copy the ASCII digits of buf[start:end] into out.
+
+        Stops once out is full; returns the number of digits seen, which
+        is len(out) + 1 when the slice holds more digits than fit.
+        """
+        count = 0
+        limit = out.shape[0]
+        for j in range(start, end):
+            c = buf[j]
+            if 48 <= c <= 57:
+                if count == limit:
+                    return count + 1
+                out[count] = c
+                count += 1
+        return count
+
+    @numba.njit(cache=True, nogil=True, boundscheck=False)
+    def phone_normalize_bulk(buf, offsets, out, ok):
+        """
+        Format each string slice buf[offsets[i]:offsets[i + 1]] as XXX-XXX-XXXX.
+
+        Writes 12 ASCII bytes per row into out and sets ok[i] to False for
+        rows without 10 digits (or 11 with a leading US country code).
+        """
+        scratch = np.empty(11, dtype=np.uint8)
+        for i in range(offsets.shape[0] - 1):
+            count = digits_only(buf, offsets[i], offsets[i + 1], scratch)
+
+            first = 0
+            if count == 11 and scratch[0] == 49:
+                first = 1
+            elif count != 10:
+                ok[i] = False
+                continue
+
+            ok[i] = True
+            k = i * 12
+            for d in range(10):
+                if d == 3 or d == 6:
+                    out[k] = 45
+                    k += 1
+                out[k] = scratch[first + d]
+                k += 1
+
+    @numba.njit(cache=True, nogil=True, boundscheck=False)
+    def _read_number(buf, start, width):
+        """Parse width ASCII digits at buf[start]; -1 if any byte is not a digit."""
+        value = 0
+        for j in range(start, start + width):
+            c = buf[j]
+            if c < 48 or c > 57:
+                return -1
+            value = value * 10 + (c - 48)
+        return value
+
+    @numba.njit(cache=True, nogil=True, boundscheck=False)
+    def fixed_width_dates_bulk(buf, offsets, year_at, month_at, day_at, first_sep, second_sep, separator, out, ok):
+        """
+        Convert 10-character, zero-padded dates to ISO-8601 (YYYY-MM-DD).
+
+        The layout is given as byte offsets of the 4-digit year, 2-digit
+        month and day and the two separators (e.g. %m/%d/%Y is 6, 0, 3,
+        2, 5, "/"). Writes 10 bytes per row into out; ok[i] is False for
+        rows of another shape, naming an impossible date, or with a year
+        below 1000 (which strptime formats without zero padding).
+        """
+        for i in range(offsets.shape[0] - 1):
+            start = offsets[i]
+            ok[i] = False
+            if offsets[i + 1] - start != 10:
+                continue
+            if buf[start + first_sep] != separator or buf[start + second_sep] != separator:
+                continue
+
+            year = _read_number(buf, start + year_at, 4)
+            month = _read_number(buf, start + month_at, 2)
+            day = _read_number(buf, start + day_at, 2)
+            if year < 1000 or month < 1 or month > 12 or day < 1:
+                continue
+            if month == 2:
+                leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+                days_in_month = 29 if leap else 28
+            elif month == 4 or month == 6 or month == 9 or month == 11:
+                days_in_month = 30
+            else:
+                days_in_month = 31
+            if day > days_in_month:
+                continue
+
+            ok[i] = True
+            k = i * 10
+            for j in range(4):
+                out[k + j] = buf[start + year_at + j]
+            out[k + 4] = 45
+            out[k + 5] = buf[start + month_at]
+            out[k + 6] = buf[start + month_at + 1]
+            out[k + 7] = 45
+            out[k + 8] = buf[start + day_at]
+            out[k + 9] = buf[start + day_at + 1]
+
+else:
+    digits_only = None
+    phone_normalize_bulk = None
+    fixed_width_dates_bulk = None
@@ -7,17 +7,54 @@ files from multiple healthcare partners into a unified, standardized format.
 
 from __future__ import annotations
 
+import codecs
+import collections
 import csv
+import fnmatch
+import functools
+import hashlib
+import io
+import itertools
 import logging
+import operator
+import os
+import pickle
 import re
 import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterable, Iterator, Mapping, NoReturn, Sequence
 
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.compute as pc
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import ryaml
+except ImportError:  # Optional: rapidyaml bindings, faster than libyaml for config loads
+    ryaml = None
+
+try:
+    import numpy as np
+except ImportError:  # Only needed by the optional Numba kernels
+    np = None
+
+try:
+    from . import fast_transforms
+    from .uring_reader import read_files_bulk
+except ImportError:  # Run as a script, or imported with src/ on sys.path
+    import fast_transforms
+    from uring_reader import read_files_bulk
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,20 +63,230 @@ logging.basicConfig(
 )
 logger = logging.getLogger("eligibility_pipeline")
 
+# Parsed configuration files are cached here, keyed on path, mtime and size
+CONFIG_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "eligibility_pipeline"
+
+# Precompiled patterns used once per row. The email and phone patterns are
+# also handed to Arrow (RE2) by validate_batch, so they stay RE2-compatible
+# and are applied with fullmatch: "$" alone would accept a trailing newline
+# in Python but not in RE2
+_NON_DIGIT_RE = re.compile(r"\D")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_PHONE_RE = re.compile(r"^\d{3}-\d{3}-\d{4}$")
+
+# Every byte except ASCII digits; bytes.translate(None, ...) strips them in one
+# C-level pass, cheaper than both _NON_DIGIT_RE.sub and str.translate
+_PHONE_DELETE_BYTES = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+
+
+# =============================================================================
+# Date Parsers
+# =============================================================================
+
+DateParser = Callable[[str], str]
+
+
+@functools.lru_cache(maxsize=4096)
+def _strptime_iso(value: str, input_format: str) -> str:
+    """
+    Convert value to ISO-8601 via strptime, memoized per (value, format).
+    
+    strptime takes a global lock and goes through its format regex on every
+    call; date columns repeat values heavily, so most calls are cache hits.
+    Failures raise ValueError and are not cached.
+    """
+    return datetime.strptime(value, input_format).strftime("%Y-%m-%d")
+
+
+# The patterns strptime itself uses for these directives, so a derived
+# regex accepts exactly what strptime would (e.g. unpadded "3/5/1955")
+_DATE_DIRECTIVE_PATTERNS = {
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+}
+
+
+def _make_regex_parser(input_format: str) -> DateParser | None:
+    """
+    Build a parser from a regex derived from input_format, or None.
+    
+    Formats made only of %Y, %m and %d (each exactly once) plus literal
+    text are matched with one precompiled regex and validated with date(),
+    skipping strptime's lock and per-call format handling. Any other
+    directive returns None.
+    """
+    parts: list[str] = []
+    seen: set[str] = set()
+    for token in re.split(r"(%.)", input_format):
+        if token == "%%":
+            parts.append("%")
+        elif token.startswith("%") and len(token) == 2:
+            directive = token[1]
+            if directive not in _DATE_DIRECTIVE_PATTERNS or directive in seen:
+                return None
+            seen.add(directive)
+            parts.append(_DATE_DIRECTIVE_PATTERNS[directive])
+        else:
+            # strptime matches any whitespace run in the format with \s+
+            parts.append(r"\s+".join(re.escape(piece) for piece in re.split(r"\s+", token)))
+    if seen != set(_DATE_DIRECTIVE_PATTERNS):
+        return None
+
+    pattern = re.compile("".join(parts), re.IGNORECASE)
+
+    def parse(value: str) -> str:
+        match = pattern.fullmatch(value)
+        if match is None:
+            raise ValueError(f"time data {value!r} does not match format {input_format!r}")
+        year = int(match["Y"])
+        if year < 1000:
+            # strftime's %Y padding of small years is platform-dependent
+            return _strptime_iso(value, input_format)
+        month, day = int(match["m"]), int(match["d"])
+        date(year, month, day)  # Raises ValueError for impossible dates
+        return f"{year}-{month:02d}-{day:02d}"
+
+    return parse
+
+
+def _make_fixed_width_parser(
+    input_format: str,
+    year: slice,
+    month: slice,
+    day: slice,
+    separators: tuple[int, int],
+    separator: str,
+) -> DateParser:
+    """
+    Build a parser for a 10-character, zero-padded date layout.
+    
+    Values matching the layout are sliced by offset; anything else (e.g.
+    unpadded "3/5/1955") falls back to the format's regex parser so the
+    accepted inputs are unchanged. So do years below 1000, which strptime
+    formats without zero padding.
+    """
+    first_sep, second_sep = separators
+    fallback = _make_regex_parser(input_format)
+
+    def parse(value: str) -> str:
+        if (
+            len(value) == 10
+            and value[first_sep] == separator
+            and value[second_sep] == separator
+            and value.isascii()
+        ):
+            y, m, d = value[year], value[month], value[day]
+            if y.isdigit() and m.isdigit() and d.isdigit() and int(y) >= 1000:
+                date(int(y), int(m), int(d))  # Raises ValueError for impossible dates
+                return f"{y}-{m}-{d}"
+        return fallback(value)
+
+    return parse
+
+
+# Byte offsets of (year, month, day), the two separators, and the separator
+# for the date formats partners actually send
+_FIXED_WIDTH_DATE_LAYOUTS: dict[str, tuple[int, int, int, tuple[int, int], str]] = {
+    "%Y-%m-%d": (0, 5, 8, (4, 7), "-"),
+    "%m/%d/%Y": (6, 0, 3, (2, 5), "/"),
+    "%d-%m-%Y": (6, 3, 0, (2, 5), "-"),
+}
+
+# Hand-specialized parsers for those formats
+_FAST_DATE_PARSERS: dict[str, DateParser] = {
+    input_format: _make_fixed_width_parser(
+        input_format,
+        slice(year_at, year_at + 4),
+        slice(month_at, month_at + 2),
+        slice(day_at, day_at + 2),
+        separators,
+        separator,
+    )
+    for input_format, (year_at, month_at, day_at, separators, separator) in _FIXED_WIDTH_DATE_LAYOUTS.items()
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_date_parser(input_format: str) -> DateParser:
+    """
+    Return a parser converting a stripped date string to ISO-8601.
+    
+    The parser raises ValueError when the value does not match input_format.
+    """
+    if input_format in _FAST_DATE_PARSERS:
+        return _FAST_DATE_PARSERS[input_format]
+
+    regex_parser = _make_regex_parser(input_format)
+    if regex_parser is not None:
+        return regex_parser
+
+    def parse(value: str) -> str:
+        return _strptime_iso(value, input_format)
+
+    return parse
+
+
+# =============================================================================
+# Numba Kernels
+# =============================================================================
+
+def _string_buffers(values: pa.Array) -> tuple[np.ndarray, np.ndarray]:
+    """Return the (data, offsets) of an Arrow string array as NumPy views for the kernels."""
+    _, offsets_buf, data_buf = values.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=np.int32)[values.offset:values.offset + len(values) + 1]
+    data = np.frombuffer(data_buf, dtype=np.uint8) if data_buf is not None else np.empty(0, dtype=np.uint8)
+    return data, offsets
+
+
+def _fixed_width_strings(out: np.ndarray, num_rows: int, width: int) -> pa.Array:
+    """Wrap a kernel output buffer of num_rows * width bytes as an Arrow string array."""
+    return pa.StringArray.from_buffers(
+        num_rows,
+        pa.py_buffer(np.arange(0, (num_rows + 1) * width, width, dtype=np.int32)),
+        pa.py_buffer(out),
+    )
+
+
+def _warm_numba_kernels() -> None:
+    """Compile (or load from cache) the Numba kernels before any data is read."""
+    if fast_transforms.NUMBA_AVAILABLE:
+        DataTransformer.format_phone_bulk(pa.array(["5551234567"]))
+        DataTransformer._format_date_column(pa.array(["1990-01-01"]), "%Y-%m-%d")
+
 
 # =============================================================================
 # Data Models
 # =============================================================================
 
-@dataclass
+# Standard output field order
+OUTPUT_FIELDS = [
+    "external_id",
+    "first_name",
+    "last_name",
+    "dob",
+    "email",
+    "phone",
+    "partner_code",
+]
+
+# Arrow schema of every processed batch and of the unified output file
+OUTPUT_SCHEMA = pa.schema([(name, pa.string()) for name in OUTPUT_FIELDS])
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of a row validation check."""
     is_valid: bool
-    errors: list[str] = field(default_factory=list)
-    warnings: list[str] = field(default_factory=list)
+    errors: tuple[str, ...] = ()
+    warnings: tuple[str, ...] = ()
+
 
+# Shared result for the common case of a record with no errors or warnings
+_OK_RESULT = ValidationResult(is_valid=True)
 
-@dataclass
+
+@dataclass(slots=True)
 class ProcessingStats:
     """Statistics for pipeline processing."""
     total_rows: int = 0
@@ -47,52 +294,177 @@ class ProcessingStats:
     failed_rows: int = 0
     validation_errors: list[dict[str, Any]] = field(default_factory=list)
 
-    def add_success(self) -> None:
-        self.total_rows += 1
-        self.successful_rows += 1
+    def add_success(self, count: int = 1) -> None:
+        self.total_rows += count
+        self.successful_rows += count
 
-    def add_failure(self, row_num: int, errors: list[str], raw_data: dict) -> None:
+    def add_failure(self, row_num: int, errors: Sequence[str], raw_data: dict) -> None:
         self.total_rows += 1
         self.failed_rows += 1
         self.validation_errors.append({
             "row_number": row_num,
-            "errors": errors,
+            "errors": list(errors),
             "raw_data": raw_data,
         })
 
+    def merge(self, other: ProcessingStats) -> None:
+        """Fold another file's statistics into this one."""
+        self.total_rows += other.total_rows
+        self.successful_rows += other.successful_rows
+        self.failed_rows += other.failed_rows
+        self.validation_errors.extend(other.validation_errors)
+
     @property
     def success_rate(self) -> float:
         return (self.successful_rows / self.total_rows * 100) if self.total_rows > 0 else 0.0
 
 
-@dataclass
+# Per-field expressions for PartnerConfig.build_processor; {v} is the source value
+_FIELD_EXPRESSIONS = {
+    "external_id": "{v}.strip()",
+    "first_name": "{v}.strip().title()",
+    "last_name": "{v}.strip().title()",
+    "dob": "_format_date({v}, {date_format!r}, _parse_date, warn_counts)",
+    "email": "{v}.strip().lower()",
+    "phone": "_format_phone({v}, warn_counts)",
+}
+
+RowProcessor = Callable[[Sequence[str], dict[str, int]], tuple[str, ...]]
+RawRowProcessor = Callable[[dict[str, str], dict[str, int]], dict[str, str]]
+
+
+class _ReadOnlyDict(dict):
+    """
+    A dict that rejects changes after construction.
+    
+    Unlike MappingProxyType it can be copied, pickled and passed through
+    dataclasses.asdict.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} does not support item assignment")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> tuple[type[_ReadOnlyDict], tuple[dict[str, str]]]:
+        return type(self), (dict(self),)
+
+
+@dataclass(frozen=True, slots=True)
 class PartnerConfig:
-    """Configuration for a single partner."""
+    """
+    Configuration for a single partner.
+    
+    Immutable, since the generated row functions bake the mapping, date
+    format and partner code into their code; use dataclasses.replace to
+    derive a changed config.
+    """
     partner_code: str
     description: str
     file_pattern: str
     delimiter: str
     encoding: str
     has_header: bool
-    column_mapping: dict[str, str]
+    column_mapping: Mapping[str, str] = field(hash=False)
     date_format: str
+    _date_parser: DateParser = field(init=False, repr=False, compare=False)
+    _compiled_processor: RowProcessor = field(init=False, repr=False, compare=False)
+    _compiled_row_fn: RawRowProcessor = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen: derived fields are set through object.__setattr__
+        object.__setattr__(self, "column_mapping", _ReadOnlyDict(self.column_mapping))
+        object.__setattr__(self, "_date_parser", _compile_date_parser(self.date_format))
+        object.__setattr__(self, "_compiled_processor", self.build_processor())
+        object.__setattr__(self, "_compiled_row_fn", self.compile_row_fn())
+
+    def build_processor(self) -> RowProcessor:
+        """
+        Generate a row transformation function specialized to this partner.
+        
+        The function takes a positional row (mapped source values in
+        column_mapping order) plus a warning counter and returns the
+        standardized record as a tuple in OUTPUT_FIELDS order. Column
+        positions, the date format and the partner code are baked into
+        its body, so no configuration is consulted per row.
+        """
+        lines = ["def _process(row, warn_counts):", "    return ("]
+        for target_field, value in self._field_sources(lambda index, source_col: f"row[{index}]"):
+            lines.append(f"        {value},  # {target_field}")
+        lines.append(f"        {self.partner_code!r},  # partner_code")
+        lines.append("    )")
+        return self._exec_function("_process", lines, "processor")
+
+    def compile_row_fn(self) -> RawRowProcessor:
+        """
+        Generate a function mapping a raw record dict straight to a standardized dict.
+        
+        Each source column is read with a constant-key lookup and the
+        result is built as a dict literal, so RecordProcessor.process does
+        not walk column_mapping or build an intermediate row per record.
+        """
+        lines = ["def _row(raw, warn_counts):", "    return {"]
+        for target_field, value in self._field_sources(lambda index, source_col: f'(raw.get({source_col!r}) or "")'):
+            lines.append(f"        {target_field!r}: {value},")
+        lines.append(f"        'partner_code': {self.partner_code!r},")
+        lines.append("    }")
+        return self._exec_function("_row", lines, "row fn")
+
+    def _field_sources(self, read: Callable[[int, str], str]) -> Iterator[tuple[str, str]]:
+        """Yield (target_field, expression) in OUTPUT_FIELDS order; read renders a source column access."""
+        sources: dict[str, tuple[int, str]] = {}
+        for index, (source_col, target_field) in enumerate(self.column_mapping.items()):
+            sources[target_field] = (index, source_col)
+
+        for target_field, expression in _FIELD_EXPRESSIONS.items():
+            if target_field in sources:
+                yield target_field, expression.format(v=read(*sources[target_field]), date_format=self.date_format)
+            else:
+                yield target_field, '""'
+
+    def _exec_function(self, name: str, lines: list[str], label: str) -> Callable:
+        """Compile generated source against the transformer helpers and return the function called name."""
+        namespace = {
+            "_format_date": DataTransformer.format_date,
+            "_format_phone": DataTransformer.format_phone,
+            "_parse_date": self._date_parser,
+        }
+        code = compile("\n".join(lines), f"<{label} {self.partner_code}>", "exec")
+        exec(code, namespace)
+        return namespace[name]
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> PartnerConfig:
         """Create a PartnerConfig from a dictionary."""
         return cls(
-            partner_code=data["partner_code"],
+            partner_code=sys.intern(str(data["partner_code"])),
             description=data.get("description", ""),
             file_pattern=data["file_pattern"],
             delimiter=data["delimiter"],
             encoding=data.get("encoding", "utf-8"),
             has_header=data.get("has_header", True),
             column_mapping=data["column_mapping"],
-            date_format=data["date_format"],
+            date_format=sys.intern(str(data["date_format"])),
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields accepted by from_dict as plain, picklable values."""
+        return {
+            "partner_code": self.partner_code,
+            "description": self.description,
+            "file_pattern": self.file_pattern,
+            "delimiter": self.delimiter,
+            "encoding": self.encoding,
+            "has_header": self.has_header,
+            "column_mapping": dict(self.column_mapping),
+            "date_format": self.date_format,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class StandardizedRecord:
     """A standardized eligibility record."""
     external_id: str
@@ -138,13 +510,21 @@ class DataTransformer:
         return value.strip().lower()
 
     @staticmethod
-    def format_date(value: str | None, input_format: str) -> str:
+    def format_date(
+        value: str | None,
+        input_format: str,
+        parser: DateParser | None = None,
+        warn_counts: dict[str, int] | None = None,
+    ) -> str:
         """
         Parse date from input format and return ISO-8601 format (YYYY-MM-DD).
         
         Args:
             value: The date string to parse
             input_format: strptime format string for parsing
+            parser: Precompiled parser for input_format; looked up when omitted
+            warn_counts: If given, failures increment warn_counts["dob"]
+                instead of being logged one by one
             
         Returns:
             ISO-8601 formatted date string, or empty string if parsing fails
@@ -156,15 +536,20 @@ class DataTransformer:
         if not value:
             return ""
         
+        if parser is None:
+            parser = _compile_date_parser(input_format)
+        
         try:
-            parsed_date = datetime.strptime(value, input_format)
-            return parsed_date.strftime("%Y-%m-%d")
+            return parser(value)
         except ValueError as e:
-            logger.warning(f"Failed to parse date '{value}' with format '{input_format}': {e}")
+            if warn_counts is not None:
+                warn_counts["dob"] = warn_counts.get("dob", 0) + 1
+            elif logger.isEnabledFor(logging.WARNING):
+                logger.warning(f"Failed to parse date '{value}' with format '{input_format}': {e}")
             return ""
 
     @staticmethod
-    def format_phone(value: str | None) -> str:
+    def format_phone(value: str | None, warn_counts: dict[str, int] | None = None) -> str:
         """
         Format phone number as XXX-XXX-XXXX.
         
@@ -173,12 +558,19 @@ class DataTransformer:
         - 555-123-4567
         - 555.123.4567
         - (555) 123-4567
+        
+        If warn_counts is given, unexpected formats increment
+        warn_counts["phone"] instead of being logged one by one.
         """
         if not value or not isinstance(value, str):
             return ""
         
         # Remove all non-numeric characters
-        digits = re.sub(r"\D", "", value.strip())
+        value = value.strip()
+        if value.isascii():
+            digits = value.encode("ascii").translate(None, _PHONE_DELETE_BYTES).decode("ascii")
+        else:
+            digits = _NON_DIGIT_RE.sub("", value)
         
         # Handle 10-digit phone numbers
         if len(digits) == 10:
@@ -190,17 +582,238 @@ class DataTransformer:
             return f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
         
         # Return original if format is unexpected
-        logger.warning(f"Unexpected phone format: '{value}' ({len(digits)} digits)")
-        return value.strip()
+        if warn_counts is not None:
+            warn_counts["phone"] = warn_counts.get("phone", 0) + 1
+        elif logger.isEnabledFor(logging.WARNING):
+            logger.warning(f"Unexpected phone format: '{value}' ({len(digits)} digits)")
+        return value
+
+    @staticmethod
+    def transform_batch(
+        batch: pa.RecordBatch,
+        input_format: str,
+        warn_counts: dict[str, int] | None = None,
+    ) -> pa.RecordBatch:
+        """
+        Apply all field transformations to a batch of mapped records.
+        
+        Column-at-a-time equivalent of the per-value methods above, run on
+        Arrow compute kernels instead of once per row.
+        
+        Args:
+            batch: Batch keyed by standard field names; absent fields are
+                treated as empty strings
+            input_format: strptime format string for the dob column
+            warn_counts: If given, per-row dob and phone failures are
+                counted here instead of logged
+            
+        Returns:
+            Batch with external_id, first_name, last_name, dob, email and
+            phone columns, in that order
+        """
+        empty = pa.array([""] * batch.num_rows, type=pa.string())
+
+        def column(name: str) -> pa.Array:
+            if name in batch.schema.names:
+                return pc.utf8_trim_whitespace(batch.column(name))
+            return empty
+
+        return pa.RecordBatch.from_arrays(
+            [
+                column("external_id"),
+                DataTransformer._title_column(column("first_name")),
+                DataTransformer._title_column(column("last_name")),
+                DataTransformer._format_date_column(column("dob"), input_format, warn_counts),
+                DataTransformer._lower_column(column("email")),
+                DataTransformer.format_phone_bulk(column("phone"), warn_counts),
+            ],
+            names=["external_id", "first_name", "last_name", "dob", "email", "phone"],
+        )
+
+    @staticmethod
+    def _title_column(values: pa.Array) -> pa.Array:
+        """Title-case a column, using the byte-wise ASCII kernel when no value needs Unicode rules."""
+        if pc.all(pc.string_is_ascii(values)).as_py() is not False:
+            return pc.ascii_title(values)
+        # Arrow's utf8_title differs from str.title (final sigma, titlecase
+        # digraphs), so non-ASCII columns use the per-value helper
+        return DataTransformer._map_distinct(values, DataTransformer.to_title_case)
+
+    @staticmethod
+    def _lower_column(values: pa.Array) -> pa.Array:
+        """Lowercase a column, using the byte-wise ASCII kernel when no value needs Unicode rules."""
+        if pc.all(pc.string_is_ascii(values)).as_py() is not False:
+            return pc.ascii_lower(values)
+        return DataTransformer._map_distinct(values, DataTransformer.to_lowercase)
+
+    @staticmethod
+    def _map_distinct(values: pa.Array, transform: Callable[[str], str]) -> pa.Array:
+        """Apply a per-value transformer to each distinct value of a string column."""
+        encoded = values.dictionary_encode()
+        mapped = pa.array([transform(v) for v in encoded.dictionary.to_pylist()], type=pa.string())
+        return pc.take(mapped, encoded.indices)
+
+    @staticmethod
+    def _format_date_column(
+        values: pa.Array,
+        input_format: str,
+        warn_counts: dict[str, int] | None = None,
+    ) -> pa.Array:
+        """
+        Convert a column of dates to ISO-8601 via its distinct values.
+        
+        Arrow's strptime silently rolls invalid days over (02/30 -> 03/01),
+        so each distinct value goes through format_date instead; a column
+        of birth dates has far fewer distinct values than rows.
+        """
+        encoded = values.dictionary_encode()
+        distinct = encoded.dictionary
+        distinct_counts = None if warn_counts is None else {}
+
+        # The Numba kernel converts well-formed fixed-width values; the rest
+        # (unpadded, malformed, impossible) go through format_date
+        layout = _FIXED_WIDTH_DATE_LAYOUTS.get(input_format)
+        if fast_transforms.fixed_width_dates_bulk is not None and layout is not None and len(distinct):
+            formatted, converted = DataTransformer._format_dates_numba(distinct, layout)
+            remaining = [
+                "" if done else DataTransformer.format_date(v, input_format, warn_counts=distinct_counts)
+                for v, done in zip(distinct.to_pylist(), converted.tolist())
+            ]
+            iso_dates = pc.if_else(pa.array(converted), formatted, pa.array(remaining, type=pa.string()))
+        else:
+            iso_dates = pa.array(
+                [DataTransformer.format_date(v, input_format, warn_counts=distinct_counts) for v in distinct.to_pylist()],
+                type=pa.string(),
+            )
+        result = pc.take(iso_dates, encoded.indices)
+
+        # Count failures per row, not per distinct value
+        if distinct_counts:
+            failed = pc.and_(pc.not_equal(values, ""), pc.equal(result, ""))
+            warn_counts["dob"] = warn_counts.get("dob", 0) + pc.sum(failed).as_py()
+        return result
+
+    @staticmethod
+    def _format_dates_numba(
+        values: pa.Array,
+        layout: tuple[int, int, int, tuple[int, int], str],
+    ) -> tuple[pa.Array, np.ndarray]:
+        """Convert fixed-width dates with the Numba kernel; returns (formatted, converted mask)."""
+        year_at, month_at, day_at, (first_sep, second_sep), separator = layout
+        num_rows = len(values)
+        data, offsets = _string_buffers(values)
+
+        out = np.zeros(num_rows * 10, dtype=np.uint8)
+        ok = np.empty(num_rows, dtype=np.bool_)
+        fast_transforms.fixed_width_dates_bulk(
+            data, offsets, year_at, month_at, day_at, first_sep, second_sep, ord(separator), out, ok
+        )
+        return _fixed_width_strings(out, num_rows, 10), ok
+
+    @staticmethod
+    def format_phone_bulk(values: pa.Array, warn_counts: dict[str, int] | None = None) -> pa.Array:
+        """
+        Format a column of phone numbers as XXX-XXX-XXXX.
+        
+        Uses the Numba kernel when Numba is installed, otherwise Arrow
+        compute kernels. Both only recognize ASCII digits, so columns with
+        any non-ASCII value go through format_phone per distinct value.
+        Values with an unexpected digit count are returned stripped but
+        otherwise unchanged, as in format_phone.
+        
+        Args:
+            values: Arrow string array; nulls are treated as empty strings
+            warn_counts: If given, unexpected formats are counted in
+                warn_counts["phone"] instead of logged
+            
+        Returns:
+            Arrow string array of formatted phone numbers
+        """
+        values = pc.utf8_trim_whitespace(pc.fill_null(values, ""))
+
+        if pc.all(pc.string_is_ascii(values)).as_py() is False:
+            # format_phone's \D also keeps other scripts' digits (e.g. "١")
+            formatted, is_expected = DataTransformer._format_phone_distinct(values)
+        elif fast_transforms.phone_normalize_bulk is not None:
+            formatted, is_expected = DataTransformer._format_phone_numba(values)
+        else:
+            formatted, is_expected = DataTransformer._format_phone_arrow(values)
+
+        unexpected = pc.and_(pc.invert(is_expected), pc.not_equal(values, ""))
+        if warn_counts is not None:
+            warn_counts["phone"] = warn_counts.get("phone", 0) + (pc.sum(unexpected).as_py() or 0)
+        elif logger.isEnabledFor(logging.WARNING):
+            for value in pc.filter(values, unexpected).to_pylist():
+                logger.warning(f"Unexpected phone format: '{value}'")
+
+        # Return original if format is unexpected
+        return pc.if_else(is_expected, formatted, values)
+
+    @staticmethod
+    def _format_phone_distinct(values: pa.Array) -> tuple[pa.Array, pa.Array]:
+        """Format trimmed phone numbers with format_phone, once per distinct value."""
+        encoded = values.dictionary_encode()
+        formatted: list[str] = []
+        expected: list[bool] = []
+        for value in encoded.dictionary.to_pylist():
+            failures: dict[str, int] = {}
+            formatted.append(DataTransformer.format_phone(value, failures))
+            expected.append(not failures)
+        return (
+            pc.take(pa.array(formatted, type=pa.string()), encoded.indices),
+            pc.take(pa.array(expected, type=pa.bool_()), encoded.indices),
+        )
+
+    @staticmethod
+    def _format_phone_arrow(values: pa.Array) -> tuple[pa.Array, pa.Array]:
+        """Format trimmed phone numbers with Arrow compute kernels."""
+        digits = pc.replace_substring_regex(values, pattern=_NON_DIGIT_RE.pattern, replacement="")
+        length = pc.binary_length(digits)
+
+        # Drop the leading US country code from 11-digit numbers
+        has_country_code = pc.and_(pc.equal(length, 11), pc.starts_with(digits, "1"))
+        digits = pc.if_else(has_country_code, pc.utf8_slice_codeunits(digits, 1), digits)
+        is_expected = pc.or_(pc.equal(length, 10), has_country_code)
+
+        formatted = pc.binary_join_element_wise(
+            pc.utf8_slice_codeunits(digits, 0, 3),
+            pc.utf8_slice_codeunits(digits, 3, 6),
+            pc.utf8_slice_codeunits(digits, 6, 10),
+            "-",
+        )
+        return formatted, is_expected
+
+    @staticmethod
+    def _format_phone_numba(values: pa.Array) -> tuple[pa.Array, pa.Array]:
+        """Format trimmed phone numbers with the Numba kernel over Arrow buffers."""
+        num_rows = len(values)
+        data, offsets = _string_buffers(values)
+
+        out = np.zeros(num_rows * 12, dtype=np.uint8)
+        ok = np.empty(num_rows, dtype=np.bool_)
+        fast_transforms.phone_normalize_bulk(data, offsets, out, ok)
+
+        formatted = _fixed_width_strings(out, num_rows, 12)
+        return formatted, pa.array(ok)
 
 
 # =============================================================================
 # Validators
 # =============================================================================
 
+# Positions of the validated fields in a standardized record tuple
+_EXTERNAL_ID_IDX = OUTPUT_FIELDS.index("external_id")
+_DOB_IDX = OUTPUT_FIELDS.index("dob")
+_EMAIL_IDX = OUTPUT_FIELDS.index("email")
+_PHONE_IDX = OUTPUT_FIELDS.index("phone")
+
+
 class RecordValidator:
     """Validates eligibility records."""
 
+    # Positions of the required fields in a standardized record tuple
+    REQUIRED_IDX = (_EXTERNAL_ID_IDX,)
+
     @staticmethod
     def validate(record: dict[str, str], row_num: int) -> ValidationResult:
         """
@@ -213,35 +826,88 @@ class RecordValidator:
         Returns:
             ValidationResult with status and any errors/warnings
         """
-        errors: list[str] = []
-        warnings: list[str] = []
+        return RecordValidator.validate_tuple(tuple(record.get(name, "") for name in OUTPUT_FIELDS), row_num)
+
+    @staticmethod
+    def validate_tuple(row: Sequence[str], row_num: int) -> ValidationResult:
+        """
+        Validate a standardized record given as a tuple in OUTPUT_FIELDS order.
+        
+        Args:
+            row: The record to validate, as produced by RecordProcessor.process_row
+            row_num: Row number for error reporting
+            
+        Returns:
+            ValidationResult with status and any errors/warnings
+        """
+        # Empty tuples are shared, so a clean record allocates nothing here
+        errors: tuple[str, ...] = ()
+        warnings: tuple[str, ...] = ()
 
-        # Required field: external_id
-        external_id = record.get("external_id", "").strip()
-        if not external_id:
-            errors.append("Missing required field: external_id")
+        # Required fields
+        for index in RecordValidator.REQUIRED_IDX:
+            if not row[index].strip():
+                errors += (f"Missing required field: {OUTPUT_FIELDS[index]}",)
 
         # Validate date format (if present)
-        dob = record.get("dob", "")
+        dob = row[_DOB_IDX]
         if dob and not RecordValidator._is_valid_iso_date(dob):
-            warnings.append(f"Invalid date format for dob: '{dob}'")
+            warnings += (f"Invalid date format for dob: '{dob}'",)
 
         # Validate email format (if present)
-        email = record.get("email", "")
+        email = row[_EMAIL_IDX]
         if email and not RecordValidator._is_valid_email(email):
-            warnings.append(f"Invalid email format: '{email}'")
+            warnings += (f"Invalid email format: '{email}'",)
 
         # Validate phone format (if present)
-        phone = record.get("phone", "")
+        phone = row[_PHONE_IDX]
         if phone and not RecordValidator._is_valid_phone(phone):
-            warnings.append(f"Phone may have unexpected format: '{phone}'")
+            warnings += (f"Phone may have unexpected format: '{phone}'",)
+
+        if not errors and not warnings:
+            return _OK_RESULT
 
         return ValidationResult(
-            is_valid=len(errors) == 0,
+            is_valid=not errors,
             errors=errors,
             warnings=warnings,
         )
 
+    @staticmethod
+    def validate_batch(batch: pa.RecordBatch) -> tuple[pa.BooleanArray, pa.BooleanArray]:
+        """
+        Validate a batch of standardized records column-at-a-time.
+        
+        Mirrors validate(): rows failing a required-field check are invalid,
+        rows with a malformed optional field carry warnings. The dob check is
+        a shape check only, which is exact for values produced by
+        DataTransformer.format_date.
+        
+        Args:
+            batch: Standardized batch (see RecordProcessor.process_batch)
+            
+        Returns:
+            Tuple of (is_valid mask, has_warnings mask)
+        """
+        external_id = pc.utf8_trim_whitespace(batch.column("external_id"))
+        is_valid = pc.greater(pc.utf8_length(external_id), 0)
+
+        def malformed(name: str, pattern: str) -> pa.BooleanArray:
+            values = batch.column(name)
+            return pc.and_(
+                pc.not_equal(values, ""),
+                pc.invert(pc.match_substring_regex(values, pattern)),
+            )
+
+        has_warnings = pc.or_(
+            pc.or_(
+                malformed("dob", r"^\d{4}-\d{2}-\d{2}$"),
+                malformed("email", _EMAIL_RE.pattern),
+            ),
+            malformed("phone", _PHONE_RE.pattern),
+        )
+        return is_valid, has_warnings
+
     @staticmethod
     def _is_valid_iso_date(value: str) -> bool:
         """Check if value is a valid ISO-8601 date."""
@@ -254,14 +920,12 @@ class RecordValidator:
     @staticmethod
     def _is_valid_email(value: str) -> bool:
         """Basic email format validation."""
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return bool(re.match(pattern, value))
+        return _EMAIL_RE.fullmatch(value) is not None
 
     @staticmethod
     def _is_valid_phone(value: str) -> bool:
         """Check if phone matches XXX-XXX-XXXX format."""
-        pattern = r"^\d{3}-\d{3}-\d{4}$"
-        return bool(re.match(pattern, value))
+        return _PHONE_RE.fullmatch(value) is not None
 
 
 # =============================================================================
@@ -271,26 +935,325 @@ class RecordValidator:
 class PartnerFileReader:
     """Reads partner files based on configuration."""
 
+    # Files smaller than this are read with the csv module; the Arrow reader's
+    # setup cost outweighs its throughput on a handful of rows.
+    ARROW_MIN_BYTES = 64 * 1024
+
+    # Block size handed to the Arrow streaming reader (one RecordBatch per block)
+    ARROW_BLOCK_SIZE = 8 << 20
+
+    # Buffer size for the csv.reader path; far fewer read() calls than the 8 KB default
+    READ_BUFFER_SIZE = 1 << 20
+
+    # Encodings Arrow decodes natively; anything else goes through csv module
+    ARROW_ENCODINGS = frozenset({"utf-8", "ascii"})
+
     def __init__(self, config: PartnerConfig):
         self.config = config
+        self.header: list[str] = []
 
-    def read(self, file_path: Path) -> Iterator[dict[str, str]]:
+    def use_arrow(self, file_path: Path) -> bool:
+        """Return True if the file should be read with the Arrow batch reader."""
+        try:
+            encoding = codecs.lookup(self.config.encoding).name
+        except LookupError:
+            return False
+        if encoding not in self.ARROW_ENCODINGS:
+            return False
+        return file_path.stat().st_size >= self.ARROW_MIN_BYTES
+
+    def read(self, file_path: Path, data: bytes | None = None) -> Iterator[tuple[str, ...]]:
         """
-        Read records from a partner file.
+        Read records from a partner file one row at a time.
+        
+        The header is read once to resolve each mapped source column to a
+        position, so rows are plain tuples indexed by offset rather than
+        dictionaries keyed by column name.
         
         Args:
             file_path: Path to the input file
+            data: File contents already read into memory; file_path is
+                then only used for logging
             
         Yields:
-            Dictionary for each row with original column names as keys
+            Values of the mapped source columns, in column_mapping order;
+            columns missing from the file or the row are empty strings
         """
         logger.info(f"Reading file: {file_path}")
+        for values, _ in self._read_rows(file_path, data):
+            yield values
+
+    def read_with_rows(self, file_path: Path, data: bytes | None = None) -> Iterator[tuple[tuple[str, ...], list[str]]]:
+        """
+        Read records as read does, each paired with its full list of fields.
+        
+        The fields are what raw_record turns into a failure report; header
+        holds the file's header once the first record has been yielded.
+        """
+        logger.info(f"Reading file: {file_path}")
+        yield from self._read_rows(file_path, data)
+
+    def raw_record(self, row: list[str]) -> dict[str | None, Any]:
+        """
+        Return a row of the file being read as csv.DictReader gives it.
+        
+        Fields missing from a short row are None; fields beyond the header
+        are listed under the key None.
+        """
+        header = self.header
+        record: dict[str | None, Any] = dict(zip(header, row))
+        if len(row) > len(header):
+            record[None] = row[len(header):]
+        else:
+            for name in header[len(row):]:
+                record[name] = None
+        return record
+
+    def raw_records(self, file_path: Path, row_nums: Iterable[int], data: bytes | None = None) -> dict[int, dict]:
+        """
+        Re-read the file for the raw_record of each of row_nums.
         
-        with open(file_path, "r", encoding=self.config.encoding) as f:
-            reader = csv.DictReader(f, delimiter=self.config.delimiter)
+        Rows are numbered as process_partner numbers them: the header is
+        row 1 and blank lines are skipped. Reading stops after the last
+        requested row.
+        """
+        wanted = set(row_nums)
+        last = max(wanted, default=1)
+        records: dict[int, dict] = {}
+        for row_num, (_, row) in enumerate(self._read_rows(file_path, data), start=2):
+            if row_num > last:
+                break
+            if row_num in wanted:
+                records[row_num] = self.raw_record(row)
+        return records
+
+    def _read_rows(self, file_path: Path, data: bytes | None) -> Iterator[tuple[tuple[str, ...], list[str]]]:
+        """Yield (mapped values, fields) for each non-blank row; see read."""
+        raw_file = io.BytesIO(data) if data is not None else open(file_path, "rb", buffering=self.READ_BUFFER_SIZE)
+        with raw_file as raw, \
+                io.TextIOWrapper(raw, encoding=self.config.encoding, newline="") as f:
+            reader = self._split_rows(f, self.config.delimiter)
+            header = next(reader, [])
+            if header:
+                header[0] = header[0].lstrip("\ufeff")  # As in _read_header
+            self.header = header
+            field_indices = self._field_indices(header)
+            pick = self._row_picker(field_indices, len(header))
             
             for row in reader:
-                yield row
+                if not row:
+                    continue
+                try:
+                    yield pick(row), row
+                except IndexError:
+                    # Short row: pad the missing trailing columns
+                    width = len(row)
+                    yield tuple(row[index] if index < width else "" for index in field_indices), row
+
+    @staticmethod
+    def _split_rows(f: io.TextIOBase, delimiter: str) -> Iterator[list[str]]:
+        """
+        Split lines on the delimiter until the first quote character.
+        
+        Partner files are almost never quoted, and str.split beats the
+        csv.reader state machine; from the first line containing a quote
+        on, the rest of the file goes through csv.reader so quoted fields
+        (including embedded delimiters and line breaks) parse as before.
+        Blank lines yield empty lists, as csv.reader does.
+        """
+        for line in f:
+            if '"' in line:
+                yield from csv.reader(itertools.chain([line], f), delimiter=delimiter)
+                return
+            line = line.rstrip("\r\n")
+            yield line.split(delimiter) if line else []
+
+    def _field_indices(self, header: list[str]) -> list[int]:
+        """
+        Map each source column in column_mapping to its header position.
+        
+        Columns missing from the header get an out-of-range index so they
+        read as empty strings.
+        """
+        positions = {name: index for index, name in enumerate(header)}
+        missing = len(header)
+        return [positions.get(source_col, missing) for source_col in self.config.column_mapping]
+
+    @staticmethod
+    def _row_picker(field_indices: list[int], header_width: int) -> Callable[[list[str]], tuple[str, ...]]:
+        """
+        Return a function selecting field_indices from a row as a tuple.
+        
+        Uses operator.itemgetter (one C call per row) when every mapped
+        column is in the header; the picker raises IndexError on rows
+        shorter than the header.
+        """
+        if len(field_indices) > 1 and max(field_indices) < header_width:
+            return operator.itemgetter(*field_indices)
+        return lambda row: tuple(row[index] if index < header_width else "" for index in field_indices)
+
+    def read_batches(self, file_path: Path, data: bytes | None = None) -> Iterator[pa.RecordBatch]:
+        """
+        Read records from a partner file as columnar batches.
+        
+        Only the mapped source columns are read, all as strings. Columns
+        missing from the file are yielded as empty strings. Rows with the
+        wrong number of fields are padded or truncated as in read, and put
+        back at their position in the file, so both readers yield the same
+        records.
+        
+        Args:
+            file_path: Path to the input file
+            data: File contents already read into memory; file_path is
+                then only used for logging
+            
+        Yields:
+            RecordBatch for each block with original column names
+        """
+        logger.info(f"Reading file: {file_path}")
+
+        source_columns = list(self.config.column_mapping)
+        # (row number, text) of rows Arrow rejected; appended by its parser
+        malformed: collections.deque[tuple[int, str]] = collections.deque()
+
+        def keep_malformed(row: pa_csv.InvalidRow) -> str:
+            malformed.append((row.number, row.text))
+            return "skip"
+
+        read_options = pa_csv.ReadOptions(
+            encoding=self.config.encoding,
+            block_size=self.ARROW_BLOCK_SIZE,
+        )
+        parse_options = pa_csv.ParseOptions(
+            delimiter=self.config.delimiter,
+            invalid_row_handler=keep_malformed,
+        )
+        convert_options = pa_csv.ConvertOptions(
+            column_types={col: pa.string() for col in source_columns},
+            include_columns=source_columns,
+            include_missing_columns=True,
+        )
+
+        source = pa.BufferReader(data) if data is not None else self._map_file(file_path)
+        with source:
+            header = self._read_header(source)
+            if not header:
+                return  # Empty file; Arrow rejects it, csv.reader yields no rows
+            field_indices = self._field_indices(header)
+            pending: list[tuple[int, str]] = []
+            next_row = 2  # Row numbers count the header as row 1
+            reader = pa_csv.open_csv(
+                source,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            )
+            with reader:
+                while True:
+                    try:
+                        batch = reader.read_next_batch()
+                    except StopIteration:
+                        break
+                    columns = [pc.fill_null(col, "") for col in batch.columns]
+                    if malformed:
+                        while malformed:
+                            pending.append(malformed.popleft())
+                        pending.sort()
+                    if pending:
+                        columns, next_row = self._splice_rows(
+                            columns, next_row, pending, field_indices, len(header)
+                        )
+                    else:
+                        next_row += batch.num_rows
+                    yield pa.RecordBatch.from_arrays(columns, names=batch.schema.names)
+
+            pending.extend(malformed)
+            if pending:
+                pending.sort()
+                padded = [self._pad_row(text, field_indices, len(header)) for _, text in pending]
+                yield pa.RecordBatch.from_arrays(
+                    [pa.array(column, type=pa.string()) for column in zip(*padded)],
+                    names=source_columns,
+                )
+
+    def _read_header(self, source: pa.NativeFile) -> list[str]:
+        """Return the header fields of source, leaving it rewound to the start."""
+        chunks: list[bytes] = []
+        while True:
+            chunk = source.read(1 << 16)
+            chunks.append(chunk)
+            if not chunk or b"\n" in chunk:
+                break
+        source.seek(0)
+        line = b"".join(chunks).partition(b"\n")[0]
+        text = line.decode(self.config.encoding).lstrip("\ufeff")
+        return next(csv.reader([text], delimiter=self.config.delimiter), [])
+
+    def _pad_row(self, text: str, field_indices: list[int], header_width: int) -> tuple[str, ...]:
+        """Pick the mapped columns from a malformed row, as read does for short rows."""
+        fields = next(csv.reader([text], delimiter=self.config.delimiter), [])
+        width = min(len(fields), header_width)
+        return tuple(fields[index] if index < width else "" for index in field_indices)
+
+    def _splice_rows(
+        self,
+        columns: list[pa.Array],
+        first_row: int,
+        pending: list[tuple[int, str]],
+        field_indices: list[int],
+        header_width: int,
+    ) -> tuple[list[pa.Array], int]:
+        """
+        Reinsert malformed rows into a batch at their row numbers.
+        
+        Args:
+            columns: Batch columns, in column_mapping order
+            first_row: Row number of the first row not yet yielded
+            pending: Sorted (row number, text) of malformed rows; rows
+                placed in this batch are removed
+            field_indices: Header position of each mapped column
+            header_width: Number of header fields
+            
+        Returns:
+            The spliced columns and the row number following them
+        """
+        num_rows = len(columns[0])
+        order: list[int] = []
+        extra: list[tuple[str, ...]] = []
+        row_num = first_row
+        good = 0
+        # Rows Arrow could not number (-1) go in at the current position
+        while good < num_rows or (pending and pending[0][0] <= row_num):
+            if pending and pending[0][0] <= row_num:
+                _, text = pending.pop(0)
+                order.append(num_rows + len(extra))
+                extra.append(self._pad_row(text, field_indices, header_width))
+            else:
+                order.append(good)
+                good += 1
+            row_num += 1
+
+        if not extra:
+            return columns, row_num
+        indices = pa.array(order, type=pa.int64())
+        spliced = [
+            pa.concat_arrays([column, pa.array(values, type=pa.string())]).take(indices)
+            for column, values in zip(columns, zip(*extra))
+        ]
+        return spliced, row_num
+
+    @staticmethod
+    def _map_file(file_path: Path) -> pa.NativeFile:
+        """
+        Memory-map file_path for the Arrow reader, hinting a sequential scan.
+        
+        Arrow reads blocks as zero-copy slices of the mapping instead of
+        copying them out with read() calls.
+        """
+        mapped = pa.memory_map(str(file_path), "r")
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(mapped.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return mapped
 
 
 # =============================================================================
@@ -303,40 +1266,222 @@ class RecordProcessor:
     def __init__(self, config: PartnerConfig):
         self.config = config
         self.transformer = DataTransformer()
+        self._warn_counts: dict[str, int] = {}
 
     def process(self, raw_record: dict[str, str]) -> dict[str, str]:
         """
         Transform a raw record into standardized format.
         
+        Date and phone problems are logged for each record, as this is
+        the entry point for callers outside process_partner; process_row
+        and process_batch count them for log_warning_summary instead.
+        
         Args:
             raw_record: Raw record with partner-specific column names
             
         Returns:
             Standardized record dictionary
         """
-        # Map columns using configuration
-        mapped = self._map_columns(raw_record)
+        return self.config._compiled_row_fn(raw_record, None)
+
+    def process_row(self, values: Sequence[str]) -> tuple[str, ...]:
+        """
+        Transform a positional row into standardized format.
+        
+        Args:
+            values: Mapped source values in column_mapping order, as
+                yielded by PartnerFileReader.read
+            
+        Returns:
+            Standardized record as a tuple in OUTPUT_FIELDS order
+        """
+        return self.config._compiled_processor(values, self._warn_counts)
+
+    def process_batch(self, batch: pa.RecordBatch) -> pa.RecordBatch:
+        """
+        Transform a batch of raw records into standardized format.
         
+        Args:
+            batch: Raw batch with partner-specific column names
+            
+        Returns:
+            Standardized batch with one column per output field
+        """
+        # Map columns using configuration
+        mapped = pa.RecordBatch.from_arrays(
+            [
+                batch.column(source_col)
+                for source_col in self.config.column_mapping
+                if source_col in batch.schema.names
+            ],
+            names=[
+                target_field
+                for source_col, target_field in self.config.column_mapping.items()
+                if source_col in batch.schema.names
+            ],
+        )
+
         # Apply transformations
-        return {
-            "external_id": mapped.get("external_id", "").strip(),
-            "first_name": self.transformer.to_title_case(mapped.get("first_name")),
-            "last_name": self.transformer.to_title_case(mapped.get("last_name")),
-            "dob": self.transformer.format_date(mapped.get("dob"), self.config.date_format),
-            "email": self.transformer.to_lowercase(mapped.get("email")),
-            "phone": self.transformer.format_phone(mapped.get("phone")),
-            "partner_code": self.config.partner_code,
-        }
+        transformed = self.transformer.transform_batch(mapped, self.config.date_format, self._warn_counts)
+        partner_code = pa.array([self.config.partner_code] * batch.num_rows, type=pa.string())
+        return transformed.append_column("partner_code", partner_code)
+
+    def log_warning_summary(self) -> None:
+        """Log one line per kind of transformation failure counted so far."""
+        if self._warn_counts.get("dob"):
+            logger.warning(
+                f"  {self._warn_counts['dob']} date parse failures for format '{self.config.date_format}'"
+            )
+        if self._warn_counts.get("phone"):
+            logger.warning(f"  {self._warn_counts['phone']} phone numbers with unexpected format")
 
-    def _map_columns(self, raw_record: dict[str, str]) -> dict[str, str]:
-        """Map partner columns to standard field names."""
-        mapped: dict[str, str] = {}
+
+# =============================================================================
+# Output Writer
+# =============================================================================
+
+class UnifiedFileWriter:
+    """
+    Streams standardized record batches into the unified output CSV.
+    
+    Normalized records rarely contain characters that need quoting, so each
+    batch is checked once and written unquoted by Arrow. A batch with a
+    quote, delimiter or line break in some value is formatted by
+    csv.writer instead, which quotes only those values, so the output is
+    byte for byte what csv.DictWriter wrote (Arrow's "needed" style would
+    quote every string field of the batch). Small clean batches (e.g. one per small input file) are held back and
+    written together once FLUSH_BYTES have accumulated, and writes go
+    through a large output buffer rather than one syscall per Arrow chunk.
+    
+    Concurrent producers can keep the output in a fixed order by writing
+    with a slot number (0, 1, ... in output order) and calling finish()
+    once a slot is complete: the earliest unfinished slot is written
+    straight through, later slots are held in memory until every slot
+    before them has finished.
+    
+    Records go to a temporary file next to output_path, which close()
+    moves into place; leaving the context on an exception discards it,
+    so a failed run never replaces earlier output with a partial file.
+    """
+
+    # Output buffer size; Arrow emits one small write per 1024 rows otherwise
+    BUFFER_SIZE = 1 << 20
+
+    # Pending batches are written once they hold at least this much data
+    FLUSH_BYTES = 1 << 20
+
+    # Rows end in CRLF, as csv.DictWriter wrote them
+    _EOL = "\r\n"
+    _UNQUOTED = pa_csv.WriteOptions(include_header=False, eol=_EOL, quoting_style="none")
+    _SPECIAL_CHARS = r'[",\r\n]'
+
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self.rows_written = 0
+        self._lock = threading.Lock()
+        self._pending: list[pa.RecordBatch] = []
+        self._pending_bytes = 0
+        self._head_slot = 0
+        self._held: dict[int, list[tuple[pa.RecordBatch, bytes | None]]] = {}
+        self._finished: set[int] = set()
         
-        for source_col, target_field in self.config.column_mapping.items():
-            if source_col in raw_record:
-                mapped[target_field] = raw_record[source_col]
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        self._sink = pa.output_stream(str(self._tmp_path), buffer_size=self.BUFFER_SIZE)
+        self._sink.write((",".join(OUTPUT_SCHEMA.names) + self._EOL).encode("utf-8"))
+
+    def write_batch(self, batch: pa.RecordBatch, slot: int | None = None) -> None:
+        """
+        Append a batch to the output; safe to call from worker threads.
         
-        return mapped
+        Without a slot the batch is written right away; with one it is
+        written after the batches of every earlier slot.
+        """
+        if batch.num_rows == 0:
+            return
+        quoted = self._format_quoted(batch) if self._needs_quoting(batch) else None
+        with self._lock:
+            self.rows_written += batch.num_rows
+            if slot is not None and slot != self._head_slot:
+                self._held.setdefault(slot, []).append((batch, quoted))
+                return
+            self._write(batch, quoted)
+
+    def finish(self, slot: int) -> None:
+        """Mark a slot complete, writing out the held batches it was blocking."""
+        with self._lock:
+            self._finished.add(slot)
+            while self._head_slot in self._finished:
+                self._finished.remove(self._head_slot)
+                self._head_slot += 1
+                for batch, quoted in self._held.pop(self._head_slot, ()):
+                    self._write(batch, quoted)
+
+    def _write(self, batch: pa.RecordBatch, quoted: bytes | None) -> None:
+        """Write a batch, or its csv.writer formatting if given; the caller holds the lock."""
+        if quoted is not None:
+            self._flush_pending()  # Keep earlier rows in order
+            self._sink.write(quoted)
+            return
+        self._pending.append(batch)
+        self._pending_bytes += batch.nbytes
+        if self._pending_bytes >= self.FLUSH_BYTES:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Write the pending (unquoted) batches in one call; the caller holds the lock."""
+        if not self._pending:
+            return
+        pa_csv.write_csv(pa.Table.from_batches(self._pending), self._sink, self._UNQUOTED)
+        self._pending = []
+        self._pending_bytes = 0
+
+    @classmethod
+    def _format_quoted(cls, batch: pa.RecordBatch) -> bytes:
+        """Format a batch as CSV with csv.writer's minimal quoting."""
+        text = io.StringIO()
+        csv.writer(text, lineterminator=cls._EOL).writerows(
+            zip(*(column.to_pylist() for column in batch.columns))
+        )
+        return text.getvalue().encode("utf-8")
+
+    @classmethod
+    def _needs_quoting(cls, batch: pa.RecordBatch) -> bool:
+        """Check whether any value in the batch contains a CSV special character."""
+        return any(
+            pc.any(pc.match_substring_regex(column, cls._SPECIAL_CHARS)).as_py()
+            for column in batch.columns
+        )
+
+    def close(self) -> None:
+        """Flush the output and move it into place at output_path."""
+        try:
+            with self._lock:
+                # Slots never finished still go out in slot order
+                for slot in sorted(self._held):
+                    for batch, quoted in self._held.pop(slot):
+                        self._write(batch, quoted)
+                self._flush_pending()
+            self._sink.close()
+        except BaseException:
+            self.discard()
+            raise
+        os.replace(self._tmp_path, self.output_path)
+
+    def discard(self) -> None:
+        """Close and delete the partial output, leaving output_path untouched."""
+        if not self._sink.closed:
+            self._sink.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> UnifiedFileWriter:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
 
 
 # =============================================================================
@@ -352,54 +1497,149 @@ class EligibilityPipeline:
     """
 
     # Standard output field order
-    OUTPUT_FIELDS = [
-        "external_id",
-        "first_name",
-        "last_name",
-        "dob",
-        "email",
-        "phone",
-        "partner_code",
-    ]
-
-    def __init__(self, config_path: Path):
+    OUTPUT_FIELDS = OUTPUT_FIELDS
+
+    # Rows buffered by the csv-module path before they are written out
+    ROW_BATCH_SIZE = 64 * 1024
+
+    # Below this many files a process pool costs more to start than it saves
+    MIN_FILES_FOR_PROCESSES = 4
+
+    def __init__(self, config_path: Path, config_cache_dir: Path | None = CONFIG_CACHE_DIR):
         """
         Initialize the pipeline with a configuration file.
         
         Args:
             config_path: Path to the YAML configuration file
+            config_cache_dir: Directory for the parsed-config cache; None disables it
         """
         self.config_path = config_path
+        self.config_cache_dir = config_cache_dir
         self.partner_configs: dict[str, PartnerConfig] = {}
         self._load_config()
+        _warm_numba_kernels()
+
+    @classmethod
+    def from_partner_configs(cls, partner_configs: Mapping[str, PartnerConfig]) -> EligibilityPipeline:
+        """
+        Build a pipeline around already-loaded partner configs.
+        
+        No configuration file is read; used by process-pool workers,
+        which receive their configs from the parent.
+        """
+        pipeline = cls.__new__(cls)
+        pipeline.config_path = None
+        pipeline.config_cache_dir = None
+        pipeline.partner_configs = dict(partner_configs)
+        _warm_numba_kernels()
+        return pipeline
 
     def _load_config(self) -> None:
         """Load and parse the configuration file."""
         logger.info(f"Loading configuration from: {self.config_path}")
         
-        with open(self.config_path, "r") as f:
-            config_data = yaml.safe_load(f)
+        # Stat the file once, before parsing: an edit made while it is parsed
+        # then leaves a stale key behind instead of a stale parse under a fresh key
+        cache_entry = self._config_cache_entry()
+        config_data = self._read_cached_config(cache_entry)
+        if config_data is None:
+            if ryaml is not None:
+                try:
+                    config_data = ryaml.loads(Path(self.config_path).read_text())
+                except ryaml.InvalidYamlError as e:
+                    # Surface as a YAML error so main() reports a configuration error
+                    raise yaml.YAMLError(f"{self.config_path}: {e}") from e
+            else:
+                with open(self.config_path, "r") as f:
+                    config_data = yaml.load(f, Loader=_YamlLoader)
+            self._write_cached_config(cache_entry, config_data)
         
         for partner_id, partner_data in config_data.get("partners", {}).items():
             self.partner_configs[partner_id] = PartnerConfig.from_dict(partner_data)
             logger.info(f"  Loaded partner config: {partner_id} ({partner_data['partner_code']})")
 
+    def _config_cache_entry(self) -> tuple[tuple[str, int, int], Path] | None:
+        """
+        Return the (key, cache file) pair for the current config file.
+        
+        The cache file is named after the config path alone, so a newer
+        version of the file overwrites its stale entry; mtime and size
+        live in the key stored inside it.
+        """
+        if self.config_cache_dir is None:
+            return None
+        
+        resolved = str(Path(self.config_path).resolve())
+        stat = os.stat(resolved)
+        key = (resolved, stat.st_mtime_ns, stat.st_size)
+        digest = hashlib.sha256(resolved.encode("utf-8")).hexdigest()
+        return key, self.config_cache_dir / f"{digest}.pkl"
+
+    def _read_cached_config(self, entry: tuple[tuple[str, int, int], Path] | None) -> dict[str, Any] | None:
+        """
+        Return the parsed YAML from the cache if the file is unchanged.
+        
+        entry is the file's _config_cache_entry. The raw mapping is cached
+        rather than PartnerConfig objects, which hold compiled
+        (unpicklable) parsers.
+        """
+        if entry is None:
+            return None
+        key, cache_path = entry
+        
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, config_data = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            return None
+        
+        if cached_key != key:
+            return None
+        logger.debug(f"  Using cached configuration: {cache_path}")
+        return config_data
+
+    def _write_cached_config(
+        self,
+        entry: tuple[tuple[str, int, int], Path] | None,
+        config_data: dict[str, Any],
+    ) -> None:
+        """Store parsed YAML under entry; failures only cost a re-parse next time."""
+        if entry is None:
+            return
+        key, cache_path = entry
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((key, config_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"  Could not cache configuration: {e}")
+
     def process_partner(
         self,
         partner_id: str,
         input_path: Path,
+        write_batch: Callable[[pa.RecordBatch], None],
         skip_invalid: bool = True,
-    ) -> tuple[list[dict[str, str]], ProcessingStats]:
+        use_arrow: bool | None = None,
+        data: bytes | None = None,
+    ) -> ProcessingStats:
         """
-        Process a single partner file.
+        Process a single partner file, streaming records to write_batch.
         
         Args:
             partner_id: The partner identifier from configuration
             input_path: Path to the input file
+            write_batch: Called with each batch of processed records
             skip_invalid: If True, skip invalid rows; if False, include them
+            use_arrow: Force the Arrow batch reader on (True) or off (False);
+                None picks based on file size and encoding
+            data: Contents of input_path if already read (see run's use_uring)
             
         Returns:
-            Tuple of (processed records, processing statistics)
+            Processing statistics
         """
         if partner_id not in self.partner_configs:
             raise ValueError(f"Unknown partner: {partner_id}")
@@ -408,58 +1648,198 @@ class EligibilityPipeline:
         reader = PartnerFileReader(config)
         processor = RecordProcessor(config)
         stats = ProcessingStats()
-        records: list[dict[str, str]] = []
 
         logger.info(f"Processing partner: {partner_id} ({config.partner_code})")
 
-        for row_num, raw_record in enumerate(reader.read(input_path), start=2):  # Start at 2 (after header)
-            try:
-                # Transform the record
-                processed = processor.process(raw_record)
-                
-                # Validate
-                validation = RecordValidator.validate(processed, row_num)
-                
-                if validation.is_valid:
-                    records.append(processed)
-                    stats.add_success()
-                    
-                    # Log warnings if any
-                    for warning in validation.warnings:
-                        logger.warning(f"Row {row_num}: {warning}")
-                else:
-                    stats.add_failure(row_num, validation.errors, raw_record)
-                    
-                    for error in validation.errors:
-                        logger.error(f"Row {row_num}: {error}")
-                    
-                    if not skip_invalid:
-                        records.append(processed)
-
-            except Exception as e:
-                logger.error(f"Row {row_num}: Unexpected error - {e}")
-                stats.add_failure(row_num, [str(e)], raw_record)
-
+        if use_arrow is None:
+            use_arrow = reader.use_arrow(input_path)
+
+        if use_arrow:
+            row_num = 2  # Start at 2 (after header)
+            for raw_batch in reader.read_batches(input_path, data):
+                processed_batch = processor.process_batch(raw_batch)
+                write_batch(self._check_batch(
+                    processed_batch,
+                    lambda index, raw_batch=raw_batch: raw_batch.slice(index, 1).to_pylist()[0],
+                    range(row_num, row_num + raw_batch.num_rows),
+                    stats,
+                    skip_invalid,
+                ))
+                row_num += raw_batch.num_rows
+
+            # Only the mapped columns were parsed; report failures with the full row
+            if stats.validation_errors:
+                full_rows = reader.raw_records(input_path, (e["row_number"] for e in stats.validation_errors), data)
+                for error in stats.validation_errors:
+                    error["raw_data"] = full_rows.get(error["row_number"], error["raw_data"])
+        else:
+            rows: list[tuple[str, ...]] = []
+            raw_rows: list[list[str]] = []
+            row_nums: list[int] = []
+
+            def flush() -> None:
+                processed_batch = pa.RecordBatch.from_arrays(
+                    [pa.array(column, type=pa.string()) for column in zip(*rows)],
+                    schema=OUTPUT_SCHEMA,
+                )
+                write_batch(self._check_batch(
+                    processed_batch,
+                    lambda index: reader.raw_record(raw_rows[index]),
+                    row_nums,
+                    stats,
+                    skip_invalid,
+                ))
+
+            for row_num, (values, row) in enumerate(reader.read_with_rows(input_path, data), start=2):  # Start at 2 (after header)
+                try:
+                    # Transform the record
+                    rows.append(processor.process_row(values))
+                except Exception as e:
+                    logger.error(f"Row {row_num}: Unexpected error - {e}")
+                    stats.add_failure(row_num, [str(e)], reader.raw_record(row))
+                    continue
+
+                raw_rows.append(row)
+                row_nums.append(row_num)
+                if len(rows) >= self.ROW_BATCH_SIZE:
+                    flush()
+                    rows, raw_rows, row_nums = [], [], []
+            if rows:
+                flush()
+
+        processor.log_warning_summary()
         logger.info(
             f"  Completed: {stats.successful_rows}/{stats.total_rows} rows "
             f"({stats.success_rate:.1f}% success rate)"
         )
 
-        return records, stats
+        return stats
+
+    def _find_partner_files(self, input_dir: Path) -> dict[str, list[Path]]:
+        """
+        Match the files in input_dir against every partner's file_pattern.
+        
+        The directory is listed once and each name is tested against the
+        precompiled patterns, rather than globbing once per partner.
+        Patterns that reach into subdirectories still use Path.glob.
+        """
+        dispatch: dict[str, list[Path]] = {partner_id: [] for partner_id in self.partner_configs}
+        patterns: list[tuple[str, re.Pattern[str]]] = []
+
+        for partner_id, config in self.partner_configs.items():
+            if "/" in config.file_pattern or os.sep in config.file_pattern:
+                dispatch[partner_id] = sorted(input_dir.glob(config.file_pattern))
+            else:
+                patterns.append((partner_id, re.compile(fnmatch.translate(config.file_pattern))))
+
+        if patterns:
+            try:
+                with os.scandir(input_dir) as entries:
+                    names = sorted(entry.name for entry in entries if entry.is_file())
+            except FileNotFoundError:
+                names = []  # As Path.glob: a missing directory matches nothing
+            for name in names:
+                for partner_id, pattern in patterns:
+                    if pattern.match(name):
+                        dispatch[partner_id].append(input_dir / name)
+
+        return dispatch
+
+    @classmethod
+    def _check_batch(
+        cls,
+        processed_batch: pa.RecordBatch,
+        raw_record: Callable[[int], dict[str, str]],
+        row_nums: Sequence[int],
+        stats: ProcessingStats,
+        skip_invalid: bool,
+    ) -> pa.RecordBatch:
+        """
+        Validate a processed batch, log the outcome and return the rows to keep.
+        
+        Only rows flagged by the vectorized masks are revisited one at a time
+        to produce their error and warning messages.
+        
+        Args:
+            processed_batch: Standardized batch to validate
+            raw_record: Returns the raw record at a batch index, for failure reports
+            row_nums: Input file row number of each batch row
+            stats: Statistics to update
+            skip_invalid: If True, drop invalid rows from the returned batch
+        """
+        is_valid, has_warnings = RecordValidator.validate_batch(processed_batch)
+        flagged = pc.indices_nonzero(pc.or_(pc.invert(is_valid), has_warnings)).to_pylist()
+
+        stats.add_success(processed_batch.num_rows - len(flagged))
+        if flagged:
+            flagged_rows = zip(*(column.to_pylist() for column in processed_batch.take(flagged).columns))
+            for index, processed in zip(flagged, flagged_rows):
+                cls._check_record(processed, raw_record(index), row_nums[index], stats, skip_invalid)
+
+        return processed_batch.filter(is_valid) if skip_invalid else processed_batch
+
+    @staticmethod
+    def _check_record(
+        processed: Sequence[str],
+        raw_record: dict[str, str],
+        row_num: int,
+        stats: ProcessingStats,
+        skip_invalid: bool,
+    ) -> bool:
+        """Validate a processed record tuple, log the outcome and return whether to keep it."""
+        validation = RecordValidator.validate_tuple(processed, row_num)
+        
+        if validation.is_valid:
+            stats.add_success()
+            
+            # Log warnings if any
+            if logger.isEnabledFor(logging.WARNING):
+                for warning in validation.warnings:
+                    logger.warning(f"Row {row_num}: {warning}")
+            return True
+
+        stats.add_failure(row_num, validation.errors, raw_record)
+        
+        for error in validation.errors:
+            logger.error(f"Row {row_num}: {error}")
+        
+        return not skip_invalid
 
     def run(
         self,
         input_dir: Path,
         output_path: Path,
         skip_invalid: bool = True,
+        max_workers: int | None = None,
+        use_arrow: bool | None = None,
+        use_processes: bool = False,
+        use_uring: bool = False,
     ) -> dict[str, ProcessingStats]:
         """
         Run the full pipeline for all configured partners.
         
+        Files are processed concurrently on a thread pool; the Arrow and
+        Numba kernels release the GIL. The output lists partners in
+        configuration order and each partner's files in name order, every
+        row in input order, the same from run to run: the first unfinished
+        file's records are streamed out as each batch is processed, and
+        later files' records are held until the files before them finish.
+        
         Args:
             input_dir: Directory containing input files
             output_path: Path for the unified output file
             skip_invalid: If True, skip invalid rows; if False, include them
+            max_workers: Number of worker threads (default: os.cpu_count())
+            use_arrow: Read every file with the Arrow batch reader (True) or
+                csv.reader (False); by default each file picks by size and
+                encoding
+            use_processes: Process files on a process pool instead of
+                threads, sidestepping the GIL on the csv.reader path; used
+                only with at least MIN_FILES_FOR_PROCESSES files
+            use_uring: On the thread pool, read input files up front with
+                batched io_uring requests (buffered reads where liburing is
+                unavailable); each file is handed to a worker as soon as it
+                has been read, and reading pauses while every worker is busy
             
         Returns:
             Dictionary mapping partner_id to ProcessingStats
@@ -468,32 +1848,86 @@ class EligibilityPipeline:
         logger.info("Starting Healthcare Eligibility Pipeline")
         logger.info("=" * 60)
 
-        all_records: list[dict[str, str]] = []
         all_stats: dict[str, ProcessingStats] = {}
+        work_items: list[tuple[str, Path]] = []
+        dispatch = self._find_partner_files(input_dir)
 
         for partner_id, config in self.partner_configs.items():
-            # Find matching files
-            pattern = config.file_pattern
-            matching_files = list(input_dir.glob(pattern))
+            matching_files = dispatch[partner_id]
 
             if not matching_files:
-                logger.warning(f"No files found for partner {partner_id} (pattern: {pattern})")
+                logger.warning(f"No files found for partner {partner_id} (pattern: {config.file_pattern})")
                 continue
 
             for file_path in matching_files:
-                records, stats = self.process_partner(partner_id, file_path, skip_invalid)
-                all_records.extend(records)
-                all_stats[partner_id] = stats
-
-        # Write unified output
-        self._write_output(all_records, output_path)
+                work_items.append((partner_id, file_path))
+
+        for partner_id, _ in work_items:
+            all_stats.setdefault(partner_id, ProcessingStats())
+
+        # Write unified output as records are produced
+        logger.info(f"Writing records to: {output_path}")
+        with UnifiedFileWriter(output_path) as writer:
+            if use_processes and len(work_items) >= self.MIN_FILES_FOR_PROCESSES:
+                # Configs are sent as plain dicts; compiled row functions do not pickle
+                config_dicts = {partner_id: self.partner_configs[partner_id].to_dict() for partner_id, _ in work_items}
+                with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+                    futures = [
+                        executor.submit(
+                            _process_one_file,
+                            partner_id, config_dicts[partner_id], file_path, skip_invalid, use_arrow,
+                        )
+                        for partner_id, file_path in work_items
+                    ]
+
+                    # Workers return whole files; only this process writes, in file order
+                    for (partner_id, _), future in zip(work_items, futures):
+                        batches, stats = future.result()
+                        for batch in batches:
+                            writer.write_batch(batch)
+                        all_stats[partner_id].merge(stats)
+            else:
+                max_workers = max_workers or os.cpu_count()
+                slots = {item: slot for slot, item in enumerate(work_items)}
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    if use_uring:
+                        partners_of: dict[Path, list[str]] = {}
+                        for partner_id, file_path in work_items:
+                            partners_of.setdefault(file_path, []).append(partner_id)
+                        futures: dict[tuple[str, Path], Future] = {}
+                        in_flight: set[Future] = set()
+                        for file_path, data in read_files_bulk(list(partners_of)):
+                            for partner_id in partners_of[file_path]:
+                                future = executor.submit(
+                                    self._process_in_order,
+                                    writer, slots[partner_id, file_path],
+                                    partner_id, file_path, skip_invalid, use_arrow, data,
+                                )
+                                futures[partner_id, file_path] = future
+                                in_flight.add(future)
+                            # Read the next file only once a worker is free, so at
+                            # most max_workers files are held in memory at a time
+                            while len(in_flight) >= max_workers:
+                                _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    else:
+                        futures = {
+                            (partner_id, file_path): executor.submit(
+                                self._process_in_order,
+                                writer, slots[partner_id, file_path], partner_id, file_path, skip_invalid, use_arrow,
+                            )
+                            for partner_id, file_path in work_items
+                        }
+
+                    # Per-file stats are merged on this thread only, in file order
+                    for partner_id, file_path in work_items:
+                        all_stats[partner_id].merge(futures[partner_id, file_path].result())
 
         # Summary
         logger.info("=" * 60)
         logger.info("Pipeline Complete - Summary")
         logger.info("=" * 60)
         
-        total_records = len(all_records)
+        total_records = writer.rows_written
         logger.info(f"Total records written: {total_records}")
         
         for partner_id, stats in all_stats.items():
@@ -504,16 +1938,50 @@ class EligibilityPipeline:
 
         return all_stats
 
-    def _write_output(self, records: list[dict[str, str]], output_path: Path) -> None:
-        """Write records to a CSV file."""
-        logger.info(f"Writing {len(records)} records to: {output_path}")
-        
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=self.OUTPUT_FIELDS)
-            writer.writeheader()
-            writer.writerows(records)
+
+    def _process_in_order(
+        self,
+        writer: UnifiedFileWriter,
+        slot: int,
+        partner_id: str,
+        input_path: Path,
+        skip_invalid: bool,
+        use_arrow: bool | None,
+        data: bytes | None = None,
+    ) -> ProcessingStats:
+        """Process one file on a worker thread, writing its batches at its slot in the output."""
+        stats = self.process_partner(
+            partner_id, input_path, functools.partial(writer.write_batch, slot=slot), skip_invalid, use_arrow, data
+        )
+        writer.finish(slot)
+        return stats
+
+
+@functools.lru_cache(maxsize=None)
+def _worker_pipeline(partner_id: str, config: PartnerConfig) -> EligibilityPipeline:
+    """Build a one-partner pipeline once per worker process and config."""
+    return EligibilityPipeline.from_partner_configs({partner_id: config})
+
+
+def _process_one_file(
+    partner_id: str,
+    config_dict: dict[str, Any],
+    input_path: Path,
+    skip_invalid: bool,
+    use_arrow: bool | None,
+) -> tuple[list[pa.RecordBatch], ProcessingStats]:
+    """
+    Process one partner file in a worker process, returning its batches and stats.
+    
+    The partner's config arrives as PartnerConfig.to_dict output and is
+    rebuilt here, so workers use the parent's in-memory configs rather
+    than re-reading the configuration file.
+    """
+    batches: list[pa.RecordBatch] = []
+    stats = _worker_pipeline(partner_id, PartnerConfig.from_dict(config_dict)).process_partner(
+        partner_id, input_path, batches.append, skip_invalid, use_arrow
+    )
+    return batches, stats
 
 
 # =============================================================================
@@ -561,6 +2029,32 @@ Examples:
         help="Include invalid rows in output (default: skip them)",
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of files to process concurrently (default: CPU count)",
+    )
+    
+    parser.add_argument(
+        "--reader",
+        choices=["auto", "arrow", "csv"],
+        default="auto",
+        help="Input reader: Arrow batches, csv.reader rows, or pick per file (default: auto)",
+    )
+    
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Process files on a process pool instead of threads (4+ files)",
+    )
+    
+    parser.add_argument(
+        "--uring",
+        action="store_true",
+        help="Read input files up front with batched io_uring requests (Linux, needs liburing)",
+    )
+    
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -578,6 +2072,10 @@ Examples:
             input_dir=args.input,
             output_path=args.output,
             skip_invalid=not args.include_invalid,
+            max_workers=args.workers,
+            use_arrow={"auto": None, "arrow": True, "csv": False}[args.reader],
+            use_processes=args.processes,
+            use_uring=args.uring,
         )
         return 0
 
@@ -4,11 +4,28 @@ Unit Tests for Healthcare Eligibility Pipeline
 Comprehensive test suite covering all pipeline components.
 """
 
+import copy
 import csv
+import dataclasses
+import io
+import pickle
 import tempfile
+import time
 import unittest
+from datetime import datetime
+from unittest import mock
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import yaml
+
+try:
+    import ryaml
+except ImportError:  # Optional backend; its parity test is skipped
+    ryaml = None
+
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
@@ -16,9 +33,11 @@ from pipeline import (
     DataTransformer,
     RecordValidator,
     PartnerConfig,
+    PartnerFileReader,
     RecordProcessor,
     EligibilityPipeline,
     ProcessingStats,
+    UnifiedFileWriter,
 )
 
 
@@ -53,6 +72,55 @@ class TestDataTransformer(unittest.TestCase):
         result = DataTransformer.format_date("1965-08-10", "%Y-%m-%d")
         self.assertEqual(result, "1965-08-10")
 
+    def test_format_date_fast_paths_match_strptime(self):
+        """Test specialized date parsers agree with strptime, including fallbacks."""
+        cases = {
+            "%Y-%m-%d": ["1965-08-10", "2000-02-29", "1999-02-29", "1965-8-10", "1965/08/10", "0999-01-01"],
+            "%m/%d/%Y": ["03/15/1955", "3/5/1955", "13/01/2000", "02/30/2000", "03/15/55", "01/01/0500"],
+            "%d-%m-%Y": ["25-12-1990", "31-04-1990", "5-1-1990", "1990-12-25"],
+        }
+        for input_format, values in cases.items():
+            for value in values:
+                try:
+                    expected = datetime.strptime(value, input_format).strftime("%Y-%m-%d")
+                except ValueError:
+                    expected = ""
+                with self.subTest(value=value, input_format=input_format):
+                    self.assertEqual(DataTransformer.format_date(value, input_format), expected)
+
+    def test_format_date_regex_parsers_match_strptime(self):
+        """Test regex-derived parsers for other %Y/%m/%d formats agree with strptime."""
+        cases = {
+            "%Y%m%d": ["19650810", "20000229", "19990229", "1965810", "196508100"],
+            "%d.%m.%Y": ["25.12.1990", "5.1.1990", "31.04.1990", "25-12-1990", "0500.01.01"],
+            "%Y/%m/%d": ["1965/08/10", "1965/8/ 1", "1965/13/01", "1965/08/10x"],
+            "%d %m %Y": ["25 12 1990", "25   12\t1990", "2512 1990"],
+            "%Y%%%m%%%d": ["1965%08%10", "1965%8%10", "1965-08-10"],
+            "%d-%b-%Y": ["25-Dec-1990", "25-dec-1990", "25-Foo-1990"],
+        }
+        for input_format, values in cases.items():
+            for value in values:
+                try:
+                    expected = datetime.strptime(value, input_format).strftime("%Y-%m-%d")
+                except ValueError:
+                    expected = ""
+                with self.subTest(value=value, input_format=input_format):
+                    self.assertEqual(DataTransformer.format_date(value, input_format), expected)
+
+    def test_format_date_regex_format_skips_strptime(self):
+        """Test formats built from %Y/%m/%d are parsed without calling strptime."""
+        with mock.patch("pipeline.datetime") as patched:
+            self.assertEqual(DataTransformer.format_date("10.08.1965", "%d.%m.%Y"), "1965-08-10")
+            self.assertEqual(DataTransformer.format_date("19650810", "%Y%m%d"), "1965-08-10")
+        patched.strptime.assert_not_called()
+
+    def test_format_date_generic_format_is_memoized(self):
+        """Test formats without a fast path reuse strptime results for repeated values."""
+        self.assertEqual(DataTransformer.format_date("10-Aug-1965", "%d-%b-%Y"), "1965-08-10")
+        with mock.patch("pipeline.datetime") as patched:
+            self.assertEqual(DataTransformer.format_date("10-Aug-1965", "%d-%b-%Y"), "1965-08-10")
+        patched.strptime.assert_not_called()
+
     def test_format_date_invalid(self):
         """Test date formatting with invalid input."""
         result = DataTransformer.format_date("invalid", "%m/%d/%Y")
@@ -84,6 +152,80 @@ class TestDataTransformer(unittest.TestCase):
         self.assertEqual(DataTransformer.format_phone(""), "")
         self.assertEqual(DataTransformer.format_phone(None), "")
 
+    def test_format_phone_short_and_non_ascii(self):
+        """Test short numbers are returned as given and non-ASCII separators are stripped."""
+        self.assertEqual(DataTransformer.format_phone("555-1234"), "555-1234")
+        # Non-ASCII input takes the regex path
+        self.assertEqual(DataTransformer.format_phone("555\u2013222\u20133333"), "555-222-3333")
+
+    def test_transform_batch_matches_per_value(self):
+        """Test batch transformation agrees with the per-value transformers."""
+        phones = ["5551234567", "(555) 222-3333", "15551234567", "555-1234", "", "", "", ""]
+        dates = ["03/15/1955", "02/30/2000", "invalid", "", "03/15/1955", "", "", ""]
+        batch = pa.record_batch(
+            {
+                "external_id": [" A1 ", "A2", "A3", "A4", "A5", "A6", "A7", "A8"],
+                "first_name": ["john", "o'brien", "  ALICE  ", "", "x", "ΟΔΥΣΣΕΑΣ", "ǈUBICA", "İREM"],
+                "last_name": ["mary-jane", "VAN DER BERG", "ó'neil", "élan", "mcdonald", "ΣΟΦΙΑ", "ǇUBA", "x"],
+                "dob": dates,
+                "email": ["JOHN@X.COM", "a@b.io", "", " C@D.ORG ", "e", "İ@X.COM", "ΟΔΥΣΣΕΑΣ@X.GR", "ǈ@X.COM"],
+                "phone": phones,
+            }
+        )
+
+        result = DataTransformer.transform_batch(batch, "%m/%d/%Y").to_pydict()
+
+        self.assertEqual(result["external_id"], ["A1", "A2", "A3", "A4", "A5", "A6", "A7", "A8"])
+        self.assertEqual(result["first_name"], [DataTransformer.to_title_case(v) for v in batch["first_name"].to_pylist()])
+        self.assertEqual(result["last_name"], [DataTransformer.to_title_case(v) for v in batch["last_name"].to_pylist()])
+        self.assertEqual(result["dob"], [DataTransformer.format_date(v, "%m/%d/%Y") for v in dates])
+        self.assertEqual(result["email"], [DataTransformer.to_lowercase(v) for v in batch["email"].to_pylist()])
+        self.assertEqual(result["phone"], [DataTransformer.format_phone(v) for v in phones])
+
+        # Absent fields come back as empty strings
+        sparse = DataTransformer.transform_batch(pa.record_batch({"external_id": ["A1"]}), "%m/%d/%Y").to_pydict()
+        self.assertEqual(sparse["last_name"], [""])
+        self.assertEqual(sparse["email"], [""])
+
+    def test_format_date_column_matches_per_value(self):
+        """Test column date conversion agrees with format_date, with and without Numba."""
+        cases = {
+            "%Y-%m-%d": ["1965-08-10", "2000-02-29", "1900-02-29", "0000-01-01", "0999-01-01", "1965-8-10", "1965-13-01"],
+            "%m/%d/%Y": ["03/15/1955", "3/5/1955", "02/30/2000", "04/31/1990", "12/31/1999", "01/01/0500", "", "n/a"],
+            "%d-%m-%Y": ["25-12-1990", "31-04-1990", "29-02-2004", "5-1-1990"],
+            "%Y%m%d": ["19650810", "19651310"],
+        }
+        for input_format, dates in cases.items():
+            expected = [DataTransformer.format_date(v, input_format) for v in dates]
+            values = pa.array(["padding"] + dates).slice(1)
+            with self.subTest(input_format=input_format):
+                self.assertEqual(DataTransformer._format_date_column(values, input_format).to_pylist(), expected)
+                with mock.patch("fast_transforms.fixed_width_dates_bulk", None):
+                    self.assertEqual(DataTransformer._format_date_column(values, input_format).to_pylist(), expected)
+
+    def test_format_phone_bulk_matches_per_value(self):
+        """Test bulk phone formatting agrees with format_phone, with and without Numba."""
+        phones = [
+            "5551234567", "555.222.3333", "(555) 222-3333", "15551234567",
+            "25551234567", "555-1234", "555123456789", "  555 444 5555 ", "", "n/a",
+            "555\uff11234567", "\u0665\u0665\u06651234567",
+        ]
+        expected = [DataTransformer.format_phone(v) for v in phones]
+        values = pa.array(["padding"] + phones).slice(1)
+
+        self.assertEqual(DataTransformer.format_phone_bulk(values).to_pylist(), expected)
+        with mock.patch("fast_transforms.phone_normalize_bulk", None):
+            self.assertEqual(DataTransformer.format_phone_bulk(values).to_pylist(), expected)
+
+        # The Arrow kernels themselves only see all-ASCII columns
+        ascii_values = pc.utf8_trim_whitespace(values.filter(pc.string_is_ascii(values)))
+        formatted, is_expected = DataTransformer._format_phone_arrow(ascii_values)
+        self.assertEqual(pc.if_else(is_expected, formatted, ascii_values).to_pylist(), expected[:-2])
+
+        counts: dict[str, int] = {}
+        DataTransformer.format_phone_bulk(values, counts)
+        self.assertEqual(counts, {"phone": 4})
+
 
 class TestRecordValidator(unittest.TestCase):
     """Tests for RecordValidator class."""
@@ -102,6 +244,13 @@ class TestRecordValidator(unittest.TestCase):
         self.assertTrue(result.is_valid)
         self.assertEqual(len(result.errors), 0)
 
+    def test_clean_records_share_result(self):
+        """Test records without errors or warnings reuse one immutable result."""
+        first = RecordValidator.validate({"external_id": "A1"}, 1)
+        second = RecordValidator.validate({"external_id": "A2", "email": "a@b.com"}, 2)
+        self.assertIs(first, second)
+        self.assertEqual(first.errors, ())
+
     def test_missing_external_id(self):
         """Test validation fails when external_id is missing."""
         record = {
@@ -122,10 +271,72 @@ class TestRecordValidator(unittest.TestCase):
         self.assertTrue(result.is_valid)  # Still valid (email not required)
         self.assertTrue(any("email" in w.lower() for w in result.warnings))
 
+    def test_validate_tuple_matches_validate(self):
+        """Test positional validation agrees with the dict wrapper."""
+        records = [
+            {"external_id": "A1", "first_name": "John", "last_name": "Doe", "dob": "1955-03-15",
+             "email": "a@b.com", "phone": "555-123-4567", "partner_code": "ACME"},
+            {"external_id": "  ", "dob": "1955-02-30", "email": "bad", "phone": "555-1234"},
+        ]
+        for record in records:
+            row = tuple(record.get(name, "") for name in EligibilityPipeline.OUTPUT_FIELDS)
+            with self.subTest(record=record):
+                self.assertEqual(RecordValidator.validate_tuple(row, 1), RecordValidator.validate(record, 1))
+
+        result = RecordValidator.validate_tuple(row, 1)
+        self.assertEqual(result.errors, ("Missing required field: external_id",))
+        self.assertEqual(len(result.warnings), 3)
+
+    def test_validate_batch_matches_validate(self):
+        """Test batch masks agree with per-record validation."""
+        records = [
+            {"external_id": "A1", "dob": "1955-03-15", "email": "a@b.com", "phone": "555-123-4567"},
+            {"external_id": "  ", "dob": "", "email": "", "phone": ""},
+            {"external_id": "A3", "dob": "", "email": "not-an-email", "phone": ""},
+            {"external_id": "A4", "dob": "", "email": "", "phone": "555-1234"},
+            {"external_id": "A5", "dob": "", "email": "a@b.com\n", "phone": "555-123-4567\n"},
+        ]
+        batch = pa.RecordBatch.from_pylist(records)
+
+        is_valid, has_warnings = RecordValidator.validate_batch(batch)
+
+        results = [RecordValidator.validate(record, 1) for record in records]
+        self.assertEqual(is_valid.to_pylist(), [r.is_valid for r in results])
+        self.assertEqual(has_warnings.to_pylist(), [bool(r.warnings) for r in results])
+
 
 class TestPartnerConfig(unittest.TestCase):
     """Tests for PartnerConfig class."""
 
+    def test_build_processor_specializes_mapping(self):
+        """Test the generated processor handles unmapped fields and literal quoting."""
+        config = PartnerConfig(
+            partner_code="O'NEIL",
+            description="",
+            file_pattern="*.csv",
+            delimiter=",",
+            encoding="utf-8",
+            has_header=True,
+            column_mapping={"mail": "email", "id": "external_id"},
+            date_format="%Y-%m-%d",
+        )
+        process = config.build_processor()
+
+        self.assertEqual(
+            process([" A@B.COM ", " X1 "], {}),
+            ("X1", "", "", "", "a@b.com", "", "O'NEIL"),
+        )
+
+        row_fn = config.compile_row_fn()
+        self.assertEqual(
+            row_fn({"mail": " A@B.COM ", "id": " X1 ", "extra": "ignored"}, {}),
+            {
+                "external_id": "X1", "first_name": "", "last_name": "", "dob": "",
+                "email": "a@b.com", "phone": "", "partner_code": "O'NEIL",
+            },
+        )
+        self.assertEqual(row_fn({"id": None}, {})["external_id"], "")
+
     def test_from_dict(self):
         """Test creating config from dictionary."""
         data = {
@@ -142,6 +353,55 @@ class TestPartnerConfig(unittest.TestCase):
         self.assertEqual(config.partner_code, "TEST")
         self.assertEqual(config.delimiter, ",")
 
+    def test_from_dict_numeric_partner_code(self):
+        """Test an unquoted numeric YAML partner code loads as a string."""
+        data = yaml.safe_load("""
+partner_code: 1001
+file_pattern: "test*.csv"
+delimiter: ","
+column_mapping: {id: external_id}
+date_format: "%Y-%m-%d"
+""")
+        config = PartnerConfig.from_dict(data)
+        self.assertEqual(config.partner_code, "1001")
+        self.assertEqual(RecordProcessor(config).process_row(("A1",))[-1], "1001")
+
+    def test_to_dict_round_trips(self):
+        """Test to_dict output is picklable and rebuilds an equal config."""
+        config = PartnerConfig.from_dict({
+            "partner_code": "TEST",
+            "file_pattern": "test*.csv",
+            "delimiter": "|",
+            "column_mapping": {"ID": "external_id", "DOB": "dob"},
+            "date_format": "%m/%d/%Y",
+        })
+        data = pickle.loads(pickle.dumps(config.to_dict()))
+        self.assertEqual(PartnerConfig.from_dict(data), config)
+
+    def test_config_is_immutable(self):
+        """Test configs cannot be changed after their row functions are generated."""
+        mapping = {"id": "external_id"}
+        config = PartnerConfig("TEST", "", "*.csv", ",", "utf-8", True, mapping, "%Y-%m-%d")
+        mapping["name"] = "first_name"
+
+        self.assertEqual(dict(config.column_mapping), {"id": "external_id"})
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            config.date_format = "%m/%d/%Y"
+        with self.assertRaises(TypeError):
+            config.column_mapping["name"] = "first_name"
+        self.assertEqual(hash(config), hash(dataclasses.replace(config)))
+
+    def test_config_copies(self):
+        """Test configs still deep-copy, pickle and convert with dataclasses.asdict."""
+        config = PartnerConfig("TEST", "", "*.csv", ",", "utf-8", True, {"id": "external_id"}, "%Y-%m-%d")
+
+        copied = copy.deepcopy(config)
+        self.assertEqual(copied, config)
+        with self.assertRaises(TypeError):
+            copied.column_mapping["name"] = "first_name"
+        self.assertEqual(pickle.loads(pickle.dumps(config.column_mapping)), {"id": "external_id"})
+        self.assertEqual(dataclasses.asdict(config)["column_mapping"], {"id": "external_id"})
+
 
 class TestRecordProcessor(unittest.TestCase):
     """Tests for RecordProcessor class."""
@@ -189,6 +449,260 @@ class TestRecordProcessor(unittest.TestCase):
         self.assertEqual(result["phone"], "555-123-4567")
         self.assertEqual(result["partner_code"], "ACME")
 
+    def test_process_row_matches_process(self):
+        """Test positional rows produce the same record, as a tuple, as dict rows."""
+        processor = RecordProcessor(self.acme_config)
+        raw = {
+            "MBI": "1234567890A",
+            "FNAME": "john",
+            "LNAME": "DOE",
+            "DOB": "03/15/1955",
+            "EMAIL": "JOHN.DOE@EMAIL.COM",
+            "PHONE": "5551234567",
+        }
+        values = [raw[source_col] for source_col in self.acme_config.column_mapping]
+
+        row = processor.process_row(values)
+        self.assertEqual(dict(zip(EligibilityPipeline.OUTPUT_FIELDS, row)), processor.process(raw))
+
+    def test_transformation_warnings_are_counted(self):
+        """Test bad dates and phones are counted and logged once per kind."""
+        processor = RecordProcessor(self.acme_config)
+        raw = {"MBI": "A1", "DOB": "02/30/2000", "PHONE": "555-1234"}
+        values = [raw.get(source_col, "") for source_col in self.acme_config.column_mapping]
+
+        processor.process_row(values)
+        processor.process_row(values)
+        processor.process_batch(pa.RecordBatch.from_pylist([raw]))
+
+        with self.assertLogs("eligibility_pipeline", level="WARNING") as logs:
+            processor.log_warning_summary()
+
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn("3 date parse failures for format '%m/%d/%Y'", logs.output[0])
+        self.assertIn("3 phone numbers with unexpected format", logs.output[1])
+
+
+    def test_process_logs_each_warning(self):
+        """Test the dict API logs date and phone problems per record rather than counting them."""
+        processor = RecordProcessor(self.acme_config)
+
+        with self.assertLogs("eligibility_pipeline", level="WARNING") as logs:
+            processor.process({"MBI": "A1", "DOB": "02/30/2000", "PHONE": "555-1234"})
+
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn("Failed to parse date '02/30/2000'", logs.output[0])
+        self.assertIn("Unexpected phone format: '555-1234'", logs.output[1])
+        self.assertEqual(processor._warn_counts, {})
+
+
+class TestPartnerFileReader(unittest.TestCase):
+    """Tests for PartnerFileReader class."""
+
+    def setUp(self):
+        """Set up a temporary pipe-delimited partner file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = Path(self.temp_dir) / "acme.txt"
+        self.file_path.write_text(
+            "MBI|FNAME|LNAME|DOB|EXTRA\n"
+            "1234567890A|john|DOE|03/15/1955|x\n"
+            "9876543210B|jane|smith|07/22/1948|y\n"
+        )
+        self.config = PartnerConfig(
+            partner_code="ACME",
+            description="Acme Health",
+            file_pattern="acme*.txt",
+            delimiter="|",
+            encoding="utf-8",
+            has_header=True,
+            column_mapping={
+                "MBI": "external_id",
+                "FNAME": "first_name",
+                "LNAME": "last_name",
+                "DOB": "dob",
+                "EMAIL": "email",
+            },
+            date_format="%m/%d/%Y",
+        )
+
+    def test_read_batches_mapped_columns_only(self):
+        """Test Arrow reader yields mapped columns as strings, missing ones empty."""
+        reader = PartnerFileReader(self.config)
+        rows = [row for batch in reader.read_batches(self.file_path) for row in batch.to_pylist()]
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0], {
+            "MBI": "1234567890A",
+            "FNAME": "john",
+            "LNAME": "DOE",
+            "DOB": "03/15/1955",
+            "EMAIL": "",
+        })
+
+    def test_read_batches_memory_maps_file(self):
+        """Test the Arrow reader parses a memory-mapped file, or in-memory contents when given."""
+        reader = PartnerFileReader(self.config)
+        expected = [batch.to_pylist() for batch in reader.read_batches(self.file_path)]
+
+        with mock.patch("pipeline.pa.memory_map", wraps=pa.memory_map) as memory_map:
+            mapped = [batch.to_pylist() for batch in reader.read_batches(self.file_path)]
+        memory_map.assert_called_once_with(str(self.file_path), "r")
+
+        with mock.patch("pipeline.pa.memory_map", side_effect=AssertionError("mapped")):
+            in_memory = [batch.to_pylist() for batch in reader.read_batches(self.file_path, self.file_path.read_bytes())]
+
+        self.assertEqual(mapped, expected)
+        self.assertEqual(in_memory, expected)
+
+    def test_read_positional_rows(self):
+        """Test csv reader yields mapped values in mapping order, padding gaps."""
+        self.file_path.write_text(
+            "EXTRA|DOB|MBI|FNAME|LNAME\n"
+            "x|03/15/1955|1234567890A|john|DOE\n"
+            "\n"
+            "y|07/22/1948|9876543210B\n"
+        )
+        reader = PartnerFileReader(self.config)
+        rows = list(reader.read(self.file_path))
+
+        self.assertEqual(rows, [
+            ("1234567890A", "john", "DOE", "03/15/1955", ""),
+            ("9876543210B", "", "", "07/22/1948", ""),
+        ])
+
+        # With every mapped column present, rows are picked without padding
+        mapping = {src: dst for src, dst in self.config.column_mapping.items() if src != "EMAIL"}
+        reader = PartnerFileReader(dataclasses.replace(self.config, column_mapping=mapping))
+        self.assertEqual(list(reader.read(self.file_path)), [
+            ("1234567890A", "john", "DOE", "03/15/1955"),
+            ("9876543210B", "", "", "07/22/1948"),
+        ])
+
+    def test_readers_agree_on_empty_and_bom_files(self):
+        """Test an empty file yields no rows and a UTF-8 BOM is dropped from the header on both paths."""
+        reader = PartnerFileReader(self.config)
+        self.file_path.write_bytes(b"")
+        self.assertEqual(list(reader.read(self.file_path)), [])
+        self.assertEqual(list(reader.read_batches(self.file_path)), [])
+
+        self.file_path.write_bytes(b"\xef\xbb\xbfMBI|FNAME\n1234567890A|john\n")
+        rows = list(reader.read(self.file_path))
+        batch_rows = [tuple(row.values()) for batch in reader.read_batches(self.file_path) for row in batch.to_pylist()]
+        self.assertEqual(rows, [("1234567890A", "john", "", "", "")])
+        self.assertEqual(batch_rows, rows)
+
+    def test_split_rows_matches_csv_reader(self):
+        """Test the split fast path agrees with csv.reader, switching over at the first quote."""
+        text = (
+            "MBI|FNAME|LNAME\r\n"
+            "1|john|DOE\r\n"
+            "\r\n"
+            "2| jane |\n"
+            '3|"o|brien"|"multi\nline"\n'
+            "4|bob|SMITH\n"
+        )
+        rows = list(PartnerFileReader._split_rows(io.StringIO(text, newline=""), "|"))
+        self.assertEqual(rows, list(csv.reader(io.StringIO(text, newline=""), delimiter="|")))
+        self.assertEqual(rows[4], ["3", "o|brien", "multi\nline"])
+
+    def test_use_arrow_small_file_falls_back(self):
+        """Test tiny files and non-native encodings use the csv module."""
+        reader = PartnerFileReader(self.config)
+        self.assertFalse(reader.use_arrow(self.file_path))
+
+        reader = PartnerFileReader(dataclasses.replace(self.config, encoding="latin-1"))
+        self.assertFalse(reader.use_arrow(self.file_path))
+
+
+class TestUnifiedFileWriter(unittest.TestCase):
+    """Tests for UnifiedFileWriter class."""
+
+    def test_quotes_only_when_needed(self):
+        """Test clean batches are written unquoted and special characters round-trip."""
+        output_path = Path(tempfile.mkdtemp()) / "out" / "unified.csv"
+        clean = {"external_id": "A1", "first_name": "John", "last_name": "Doe", "dob": "1955-03-15",
+                 "email": "j@x.com", "phone": "555-123-4567", "partner_code": "ACME"}
+        special = dict(clean, external_id="A2", last_name='Doe, "Jr"')
+
+        with UnifiedFileWriter(output_path) as writer:
+            writer.write_batch(pa.RecordBatch.from_pylist([clean]))
+            writer.write_batch(pa.RecordBatch.from_pylist([], schema=pa.schema(
+                [(name, pa.string()) for name in EligibilityPipeline.OUTPUT_FIELDS])))
+            writer.write_batch(pa.RecordBatch.from_pylist([special]))
+
+        self.assertEqual(output_path.read_bytes().count(b"\r\n"), 3)
+        lines = output_path.read_text().splitlines()
+        self.assertEqual(lines[0], ",".join(EligibilityPipeline.OUTPUT_FIELDS))
+        self.assertEqual(lines[1], "A1,John,Doe,1955-03-15,j@x.com,555-123-4567,ACME")
+        with open(output_path, newline="") as f:
+            self.assertEqual(list(csv.DictReader(f)), [clean, special])
+        self.assertEqual(writer.rows_written, 2)
+
+    def test_small_batches_are_coalesced(self):
+        """Test small batches are held back and written together on close."""
+        output_path = Path(tempfile.mkdtemp()) / "unified.csv"
+        record = {name: "x" for name in EligibilityPipeline.OUTPUT_FIELDS}
+
+        with mock.patch("pipeline.pa_csv.write_csv", wraps=pa_csv.write_csv) as write_csv:
+            with UnifiedFileWriter(output_path) as writer:
+                for _ in range(3):
+                    writer.write_batch(pa.RecordBatch.from_pylist([record]))
+                self.assertEqual(write_csv.call_count, 0)
+            self.assertEqual(write_csv.call_count, 1)
+
+        self.assertEqual(len(output_path.read_text().splitlines()), 4)
+
+    def test_output_bytes_match_dict_writer(self):
+        """Test output is byte-identical to csv.DictWriter, quoting only the values that need it."""
+        output_path = Path(tempfile.mkdtemp()) / "unified.csv"
+        record = {name: "x" for name in EligibilityPipeline.OUTPUT_FIELDS}
+        records = [record, dict(record, last_name="Doe, Jr"), dict(record, first_name='Al "Bo"\nC'), record]
+
+        with UnifiedFileWriter(output_path) as writer:
+            writer.write_batch(pa.RecordBatch.from_pylist(records[:1]))
+            writer.write_batch(pa.RecordBatch.from_pylist(records[1:3]))
+            writer.write_batch(pa.RecordBatch.from_pylist(records[3:]))
+
+        expected = io.StringIO()
+        dict_writer = csv.DictWriter(expected, fieldnames=EligibilityPipeline.OUTPUT_FIELDS)
+        dict_writer.writeheader()
+        dict_writer.writerows(records)
+        self.assertEqual(output_path.read_bytes(), expected.getvalue().encode("utf-8"))
+
+    def test_slots_are_written_in_order(self):
+        """Test batches written with slots come out in slot order, whatever order they arrive in."""
+        output_path = Path(tempfile.mkdtemp()) / "unified.csv"
+
+        def batch(external_id):
+            return pa.RecordBatch.from_pylist([dict.fromkeys(EligibilityPipeline.OUTPUT_FIELDS, external_id)])
+
+        with UnifiedFileWriter(output_path) as writer:
+            writer.write_batch(batch("c1"), slot=2)
+            writer.write_batch(batch("b1"), slot=1)
+            writer.finish(1)
+            writer.write_batch(batch("a1"), slot=0)
+            writer.write_batch(batch("a2"), slot=0)
+            writer.finish(0)
+            writer.write_batch(batch("c2"), slot=2)
+            writer.finish(2)
+
+        with open(output_path, newline="") as f:
+            self.assertEqual([row["external_id"] for row in csv.DictReader(f)], ["a1", "a2", "b1", "c1", "c2"])
+
+    def test_error_keeps_previous_output(self):
+        """Test leaving the writer on an exception discards the partial file."""
+        output_path = Path(tempfile.mkdtemp()) / "unified.csv"
+        output_path.write_text("previous output\n")
+        record = {name: "x" for name in EligibilityPipeline.OUTPUT_FIELDS}
+
+        with self.assertRaises(RuntimeError):
+            with UnifiedFileWriter(output_path) as writer:
+                writer.write_batch(pa.RecordBatch.from_pylist([record]))
+                raise RuntimeError("boom")
+
+        self.assertEqual(output_path.read_text(), "previous output\n")
+        self.assertEqual(list(output_path.parent.iterdir()), [output_path])
+
 
 class TestProcessingStats(unittest.TestCase):
     """Tests for ProcessingStats class."""
@@ -215,6 +729,37 @@ class TestProcessingStats(unittest.TestCase):
         self.assertEqual(stats.failed_rows, 1)
         self.assertEqual(stats.success_rate, 50.0)
 
+    def test_merge_after_pickling(self):
+        """Test stats round-trip through pickle (worker processes) and merge."""
+        worker = ProcessingStats()
+        worker.add_success(3)
+        worker.add_failure(5, ["Missing external_id"], {"raw": "data"})
+
+        stats = ProcessingStats()
+        stats.add_success()
+        stats.merge(pickle.loads(pickle.dumps(worker)))
+
+        self.assertEqual((stats.total_rows, stats.successful_rows, stats.failed_rows), (5, 4, 1))
+        self.assertEqual(stats.validation_errors[0]["row_number"], 5)
+        self.assertEqual(worker.total_rows, 4)
+
+    def test_counters_by_name(self):
+        """Test the counters can be passed, assigned and shown by name."""
+        stats = ProcessingStats(total_rows=3, successful_rows=2, failed_rows=1)
+        stats.successful_rows += 1
+        stats.total_rows = 4
+
+        self.assertEqual((stats.total_rows, stats.successful_rows, stats.failed_rows), (4, 3, 1))
+        self.assertEqual(
+            repr(stats),
+            "ProcessingStats(total_rows=4, successful_rows=3, failed_rows=1, validation_errors=[])",
+        )
+        self.assertEqual(stats, ProcessingStats(4, 3, 1))
+        self.assertEqual(
+            dataclasses.asdict(stats),
+            {"total_rows": 4, "successful_rows": 3, "failed_rows": 1, "validation_errors": []},
+        )
+
 
 class TestIntegration(unittest.TestCase):
     """Integration tests for the full pipeline."""
@@ -259,7 +804,7 @@ partners:
 
     def test_full_pipeline(self):
         """Test running the full pipeline."""
-        pipeline = EligibilityPipeline(self.config_path)
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
         stats = pipeline.run(self.input_dir, self.output_path)
 
         # Verify output file exists
@@ -281,6 +826,310 @@ partners:
         self.assertEqual(rows[0]["phone"], "555-123-4567")
         self.assertEqual(rows[0]["partner_code"], "TEST")
 
+    def test_process_partner_arrow_matches_csv(self):
+        """Test the Arrow batch path produces the same records as the csv path."""
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+        input_file = self.input_dir / "test_data.csv"
+
+        arrow_batches: list = []
+        csv_batches: list = []
+        arrow_stats = pipeline.process_partner("test_partner", input_file, arrow_batches.append, use_arrow=True)
+        csv_stats = pipeline.process_partner("test_partner", input_file, csv_batches.append, use_arrow=False)
+
+        self.assertEqual(
+            pa.Table.from_batches(arrow_batches).to_pylist(),
+            pa.Table.from_batches(csv_batches).to_pylist(),
+        )
+        self.assertEqual(arrow_stats.successful_rows, csv_stats.successful_rows)
+
+    def test_process_partner_malformed_rows_match_csv(self):
+        """Test rows with the wrong field count are padded and numbered alike by both readers."""
+        input_file = self.input_dir / "test_malformed.csv"
+        input_file.write_text(
+            "id,fname,lname,birth_date,email_addr,phone_num\n"
+            "ID001,john,DOE,1990-01-15,JOHN@TEST.COM,5551234567\n"
+            "ID002,jane,SMITH\n"
+            ",bob,JONES,1970-02-01,bob@test.com,5550001111\n"
+            "ID004,amy,LEE,1980-03-04,amy@test.com,5552223333,extra\n"
+            ",\n"
+            "ID006,tom,KIM,1975-05-06,tom@test.com,5554445555\n"
+        )
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+
+        csv_batches: list = []
+        csv_stats = pipeline.process_partner("test_partner", input_file, csv_batches.append, use_arrow=False)
+        for block_size in (PartnerFileReader.ARROW_BLOCK_SIZE, 64):
+            arrow_batches: list = []
+            with self.subTest(block_size=block_size), \
+                    mock.patch.object(PartnerFileReader, "ARROW_BLOCK_SIZE", block_size):
+                arrow_stats = pipeline.process_partner(
+                    "test_partner", input_file, arrow_batches.append, use_arrow=True
+                )
+                self.assertEqual(
+                    pa.Table.from_batches(arrow_batches).to_pylist(),
+                    pa.Table.from_batches(csv_batches).to_pylist(),
+                )
+                self.assertEqual(arrow_stats.total_rows, 6)
+                self.assertEqual(arrow_stats.validation_errors, csv_stats.validation_errors)
+                self.assertEqual([e["row_number"] for e in arrow_stats.validation_errors], [4, 6])
+
+    def test_failure_reports_keep_full_row(self):
+        """Test failure reports hold the whole input row, unmapped columns included, on both readers."""
+        input_file = self.input_dir / "test_plan.csv"
+        input_file.write_text(
+            "id,fname,lname,birth_date,email_addr,phone_num,PLAN\n"
+            "ID001,john,DOE,1990-01-15,JOHN@TEST.COM,5551234567,SILVER\n"
+            ",bob,JONES,1970-02-01,bob@test.com,5550001111,GOLD\n"
+        )
+        with open(input_file, newline="") as f:
+            expected = list(csv.DictReader(f))[1]
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+
+        for use_arrow in (False, True):
+            with self.subTest(use_arrow=use_arrow):
+                stats = pipeline.process_partner("test_partner", input_file, lambda batch: None, use_arrow=use_arrow)
+                self.assertEqual(stats.validation_errors[0]["raw_data"], expected)
+                self.assertEqual(stats.validation_errors[0]["raw_data"]["PLAN"], "GOLD")
+
+    def test_pipeline_merges_stats_across_files(self):
+        """Test files for the same partner are processed concurrently and merged in order."""
+        (self.input_dir / "test_data2.csv").write_text(
+            "id,fname,lname,birth_date,email_addr,phone_num\n"
+            "ID003,bob,JONES,1970-02-01,bob@test.com,5550001111\n"
+        )
+
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+        stats = pipeline.run(self.input_dir, self.output_path, max_workers=2)
+
+        with open(self.output_path, "r") as f:
+            rows = list(csv.DictReader(f))
+
+        self.assertEqual(stats["test_partner"].successful_rows, 3)
+        self.assertEqual(sorted(row["external_id"] for row in rows), ["ID001", "ID002", "ID003"])
+
+    def test_pipeline_process_pool(self):
+        """Test files processed on a process pool are written and merged by the parent."""
+        for index in range(3, 6):
+            (self.input_dir / f"test_data{index}.csv").write_text(
+                "id,fname,lname,birth_date,email_addr,phone_num\n"
+                f"ID00{index},bob,JONES,1970-02-01,bob@test.com,5550001111\n"
+            )
+
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+        # Workers use the in-memory config, not the file on disk
+        pipeline.partner_configs["test_partner"] = dataclasses.replace(
+            pipeline.partner_configs["test_partner"], partner_code="MEM"
+        )
+        self.config_path.unlink()
+        stats = pipeline.run(self.input_dir, self.output_path, max_workers=2, use_processes=True)
+
+        with open(self.output_path, "r") as f:
+            rows = list(csv.DictReader(f))
+
+        self.assertEqual(stats["test_partner"].successful_rows, 5)
+        self.assertEqual(
+            sorted(row["external_id"] for row in rows),
+            ["ID001", "ID002", "ID003", "ID004", "ID005"],
+        )
+        self.assertEqual({row["partner_code"] for row in rows}, {"MEM"})
+
+    def test_pipeline_prefetched_reads_match(self):
+        """Test reading files up front (io_uring or buffered fallback) matches streaming reads."""
+        (self.input_dir / "test_data2.csv").write_text(
+            "id,fname,lname,birth_date,email_addr,phone_num\n"
+            "ID003,bob,JONES,1970-02-01,bob@test.com,5550001111\n"
+        )
+        outputs = []
+        for use_arrow in (True, False):
+            for use_uring in (False, True):
+                output_path = Path(self.temp_dir) / f"output_{use_arrow}_{use_uring}.csv"
+                pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+                stats = pipeline.run(self.input_dir, output_path, use_arrow=use_arrow, use_uring=use_uring)
+                self.assertEqual(stats["test_partner"].successful_rows, 3)
+                with open(output_path, "r") as f:
+                    outputs.append(sorted(row["external_id"] for row in csv.DictReader(f)))
+
+        self.assertEqual(outputs, [["ID001", "ID002", "ID003"]] * 4)
+
+    def test_prefetched_reads_wait_for_free_workers(self):
+        """Test io_uring reads pull a file only while fewer than max_workers are in flight."""
+        for i in range(6):
+            (self.input_dir / f"test_more{i}.csv").write_text((self.input_dir / "test_data.csv").read_text())
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+        process_partner = pipeline.process_partner
+        pulled = finished = 0
+        held: list[int] = []
+
+        def counting_reads(paths):
+            nonlocal pulled
+            for path in paths:
+                held.append(pulled - finished)
+                pulled += 1
+                yield path, path.read_bytes()
+
+        def counting_process(*args):
+            nonlocal finished
+            stats = process_partner(*args)
+            finished += 1
+            return stats
+
+        with mock.patch("pipeline.read_files_bulk", counting_reads), \
+                mock.patch.object(pipeline, "process_partner", side_effect=counting_process):
+            stats = pipeline.run(self.input_dir, self.output_path, max_workers=2, use_uring=True)
+
+        self.assertEqual(stats["test_partner"].successful_rows, 14)
+        self.assertEqual(len(held), 7)
+        self.assertLessEqual(max(held), 1)
+
+    def test_run_forced_reader_matches_auto(self):
+        """Test forcing either reader through run() produces the same output."""
+        outputs = []
+        for use_arrow in (True, False):
+            output_path = Path(self.temp_dir) / f"output_{use_arrow}.csv"
+            pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+            with mock.patch.object(PartnerFileReader, "use_arrow", side_effect=AssertionError("auto-selected")):
+                stats = pipeline.run(self.input_dir, output_path, use_arrow=use_arrow)
+            self.assertEqual(stats["test_partner"].successful_rows, 2)
+            with open(output_path, "r") as f:
+                outputs.append(list(csv.DictReader(f)))
+
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_find_partner_files_single_listing(self):
+        """Test partner files are dispatched from one directory listing."""
+        (self.input_dir / "test_b.csv").write_text("id\n")
+        (self.input_dir / "other.csv").write_text("id\n")
+        (self.input_dir / "test_dir.csv").mkdir()
+
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+        dispatch = pipeline._find_partner_files(self.input_dir)
+
+        self.assertEqual(
+            dispatch["test_partner"],
+            [self.input_dir / "test_b.csv", self.input_dir / "test_data.csv"],
+        )
+
+    def test_missing_input_dir_writes_empty_output(self):
+        """Test a missing input directory finds no files instead of failing the run."""
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+        stats = pipeline.run(Path(self.temp_dir) / "missing", self.output_path)
+
+        self.assertEqual(stats, {})
+        self.assertEqual(self.output_path.read_text().splitlines(), [",".join(EligibilityPipeline.OUTPUT_FIELDS)])
+
+    def test_config_cache_skips_yaml_parse(self):
+        """Test an unchanged config is loaded from the cache without parsing YAML."""
+        cache_dir = Path(self.temp_dir) / "cache"
+        EligibilityPipeline(self.config_path, config_cache_dir=cache_dir)
+        self.assertEqual(len(list(cache_dir.glob("*.pkl"))), 1)
+
+        with mock.patch("pipeline.yaml.load", side_effect=AssertionError("YAML parsed")):
+            pipeline = EligibilityPipeline(self.config_path, config_cache_dir=cache_dir)
+        self.assertEqual(pipeline.partner_configs["test_partner"].partner_code, "TEST")
+
+        # Editing the file invalidates the cached entry
+        self.config_path.write_text(self.config_path.read_text().replace('"TEST"', '"TEST2"'))
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=cache_dir)
+        self.assertEqual(pipeline.partner_configs["test_partner"].partner_code, "TEST2")
+        self.assertEqual(len(list(cache_dir.glob("*.pkl"))), 1)
+
+    def test_config_cache_keys_on_file_before_parse(self):
+        """Test an edit made while the config is parsed is not cached under the new mtime."""
+        cache_dir = Path(self.temp_dir) / "cache"
+        original = self.config_path.read_text()
+        load = yaml.load
+
+        def edit_during_parse(stream, Loader):
+            config_data = load(stream, Loader=Loader)
+            self.config_path.write_text(original.replace('"TEST"', '"TEST2"'))
+            return config_data
+
+        with mock.patch("pipeline.ryaml", None), mock.patch("pipeline.yaml.load", side_effect=edit_during_parse):
+            pipeline = EligibilityPipeline(self.config_path, config_cache_dir=cache_dir)
+        self.assertEqual(pipeline.partner_configs["test_partner"].partner_code, "TEST")
+
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=cache_dir)
+        self.assertEqual(pipeline.partner_configs["test_partner"].partner_code, "TEST2")
+
+    def test_config_loads_with_ryaml_when_available(self):
+        """Test the rapidyaml backend is preferred over PyYAML when installed."""
+        fake_ryaml = mock.Mock()
+        fake_ryaml.loads.return_value = yaml.safe_load(self.config_path.read_text())
+
+        with mock.patch("pipeline.ryaml", fake_ryaml), \
+                mock.patch("pipeline.yaml.load", side_effect=AssertionError("PyYAML used")):
+            pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+
+        fake_ryaml.loads.assert_called_once()
+        self.assertEqual(pipeline.partner_configs["test_partner"].partner_code, "TEST")
+
+    @unittest.skipIf(ryaml is None, "ryaml not installed")
+    def test_ryaml_matches_pyyaml(self):
+        """Test the real rapidyaml backend parses the shipped config like PyYAML."""
+        partners_path = Path(__file__).parent.parent / "config" / "partners.yaml"
+        self.assertEqual(ryaml.loads(partners_path.read_text()), yaml.safe_load(partners_path.read_text()))
+
+        with_ryaml = EligibilityPipeline(partners_path, config_cache_dir=None)
+        with mock.patch("pipeline.ryaml", None):
+            with_pyyaml = EligibilityPipeline(partners_path, config_cache_dir=None)
+        self.assertEqual(with_ryaml.partner_configs, with_pyyaml.partner_configs)
+
+    def test_invalid_yaml_raises_yaml_error(self):
+        """Test a broken config surfaces as yaml.YAMLError with either backend."""
+        self.config_path.write_text("partners: [unclosed\n  test: 1\n")
+        for backend in ("ryaml", "pyyaml"):
+            if backend == "ryaml" and ryaml is None:
+                continue
+            with self.subTest(backend=backend), \
+                    mock.patch("pipeline.ryaml", ryaml if backend == "ryaml" else None):
+                with self.assertRaises(yaml.YAMLError):
+                    EligibilityPipeline(self.config_path, config_cache_dir=None)
+
+    def test_output_order_is_deterministic(self):
+        """Test files are written in name order even when later files finish first."""
+        for i in range(1, 4):
+            (self.input_dir / f"test_more{i}.csv").write_text(
+                "id,fname,lname,birth_date,email_addr,phone_num\n"
+                f"MORE{i},bob,JONES,1970-02-01,bob@test.com,5550001111\n"
+            )
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+        process_partner = pipeline.process_partner
+
+        def slow_first_file(partner_id, input_path, *args):
+            if input_path.name == "test_data.csv":
+                time.sleep(0.2)
+            return process_partner(partner_id, input_path, *args)
+
+        for use_uring in (False, True):
+            with self.subTest(use_uring=use_uring), \
+                    mock.patch.object(pipeline, "process_partner", side_effect=slow_first_file):
+                pipeline.run(self.input_dir, self.output_path, max_workers=4, use_uring=use_uring)
+                with open(self.output_path, newline="") as f:
+                    self.assertEqual(
+                        [row["external_id"] for row in csv.DictReader(f)],
+                        ["ID001", "ID002", "MORE1", "MORE2", "MORE3"],
+                    )
+
+    def test_failed_run_keeps_previous_output(self):
+        """Test a run that fails part-way leaves the existing output file untouched."""
+        self.output_path.write_text("previous output\n")
+        (self.input_dir / "test_more.csv").write_text((self.input_dir / "test_data.csv").read_text())
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+        process_partner = pipeline.process_partner
+
+        def fail_on_second_file(partner_id, input_path, *args):
+            if input_path.name == "test_more.csv":
+                raise OSError("read failed")
+            return process_partner(partner_id, input_path, *args)
+
+        with mock.patch.object(pipeline, "process_partner", side_effect=fail_on_second_file):
+            with self.assertRaises(OSError):
+                pipeline.run(self.input_dir, self.output_path, max_workers=1)
+
+        self.assertEqual(self.output_path.read_text(), "previous output\n")
+        self.assertEqual(sorted(path.name for path in Path(self.temp_dir).iterdir()),
+                         ["config.yaml", "input", "output.csv"])
+
     def test_pipeline_with_invalid_rows(self):
         """Test pipeline handling of invalid rows."""
         # Create file with invalid row (missing external_id)
@@ -310,7 +1159,7 @@ partners:
 """
         self.config_path.write_text(config_content)
 
-        pipeline = EligibilityPipeline(self.config_path)
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
         stats = pipeline.run(self.input_dir, self.output_path, skip_invalid=True)
 
         # Should only have 1 valid row
@@ -321,6 +1170,22 @@ partners:
         self.assertEqual(len(rows), 1)
         self.assertEqual(stats["test_partner"].failed_rows, 1)
 
+    def test_arrow_path_reports_invalid_rows(self):
+        """Test the Arrow batch path drops and reports invalid rows like the csv path."""
+        input_file = self.input_dir / "test_invalid.csv"
+        input_file.write_text(
+            "id,fname,lname,birth_date,email_addr,phone_num\n"
+            "ID001,john,doe,1990-01-15,john@test.com,5551234567\n"
+            ",jane,smith,1985-06-20,jane@test.com,5559876543\n"  # Missing ID
+        )
+        pipeline = EligibilityPipeline(self.config_path, config_cache_dir=None)
+
+        batches: list = []
+        arrow_stats = pipeline.process_partner("test_partner", input_file, batches.append, use_arrow=True)
+        self.assertEqual(sum(batch.num_rows for batch in batches), 1)
+        self.assertEqual(arrow_stats.failed_rows, 1)
+        self.assertEqual(arrow_stats.validation_errors[0]["row_number"], 3)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)